@@ -11,21 +11,160 @@ including:
 
 import os
 import time
+import atexit
 import hashlib
 import json
+import mmap
 import shutil
+import tempfile
+import threading
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger('cv_cache_manager')
+# BLAKE3 is optional; fall back to BLAKE2b from the standard library
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+# fcntl is POSIX-only; without it the cache can't be safely shared between processes
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# orjson is optional; fall back to the standard library json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Logging is configured by the application
+logger = logging.getLogger(__name__)
 
 # Default cache settings
-DEFAULT_CACHE_DIR = Path.home() / '.cv_generator' / 'cache'
+DEFAULT_CACHE_DIR = None  # ~/.cv_generator/cache, resolved when a manager is created
 DEFAULT_CACHE_EXPIRATION = 60 * 60 * 24 * 7  # 7 days in seconds
 DEFAULT_MAX_CACHE_SIZE = 100 * 1024 * 1024  # 100 MB in bytes
+INDEX_FLUSH_INTERVAL = 5.0  # Minimum seconds between deferred index writes
+LOG_COMPACT_SIZE = 1024 * 1024  # Compact the index log past this many bytes
+LOG_COMPACT_LINES = 10000  # ... or past this many records
+
+# Length of cache key digests in bytes (hex keys are twice as long)
+KEY_DIGEST_SIZE = 16
+
+# Levels of CV data walked in Python when hashing; deeper values (a whole
+# section's contents) are encoded in C by the JSON library
+KEY_WALK_DEPTH = 1
+
+
+def _dumps(obj: Any, indent: bool = False, sort_keys: bool = True) -> bytes:
+    """Serialize an object to JSON bytes."""
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, sort_keys=sort_keys, indent=2).encode()
+    # Match orjson's compact output so cache keys don't depend on the backend
+    return json.dumps(obj, sort_keys=sort_keys, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _canonical_feed(obj: Any, update: Callable[[bytes], Any],
+                    max_depth: int = KEY_WALK_DEPTH) -> None:
+    """
+    Feed the compact, key-sorted JSON encoding of an object to `update`.
+    
+    The bytes fed are the same as `_dumps(obj)`, but they are produced
+    piece by piece instead of as one string for the whole object. The top
+    `max_depth` levels are walked here; anything deeper is encoded by the
+    JSON library's C encoder one subtree at a time.
+    """
+    # Items are (None, token) for literal bytes or (depth, value) to encode
+    stack = [(0, obj)]
+    while stack:
+        depth, item = stack.pop()
+        if depth is None:
+            update(item)
+        elif depth >= max_depth:
+            update(_dumps(item))
+        elif isinstance(item, dict):
+            if not item:
+                update(b'{}')
+                continue
+            depth += 1
+            parts = []
+            for i, key in enumerate(sorted(item)):
+                parts.append((None, (b',' if i else b'{') + _dumps(key) + b':'))
+                parts.append((depth, item[key]))
+            parts.append((None, b'}'))
+            stack.extend(reversed(parts))
+        elif isinstance(item, (list, tuple)):
+            if not item:
+                update(b'[]')
+                continue
+            depth += 1
+            parts = [(None, b'[')]
+            for i, value in enumerate(item):
+                if i:
+                    parts.append((None, b','))
+                parts.append((depth, value))
+            parts.append((None, b']'))
+            stack.extend(reversed(parts))
+        else:
+            update(_dumps(item))
+
+
+def _new_hasher():
+    """Create a hasher for cache keys (BLAKE3 if installed, BLAKE2b otherwise)."""
+    if _blake3 is not None:
+        return _blake3()
+    return hashlib.blake2b(digest_size=KEY_DIGEST_SIZE)
+
+
+def _hexdigest(hasher) -> str:
+    """Return the hex digest of a hasher created by `_new_hasher`."""
+    if _blake3 is not None:
+        return hasher.hexdigest(KEY_DIGEST_SIZE)
+    return hasher.hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so readers see either the old or the new contents, never a mix."""
+    # Each call writes its own temporary file; readers under a shared lock
+    # may compact the index at the same time
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+    try:
+        with open(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _hash_file(file_path: Path) -> str:
+    """Hash the contents of a file through a read-only memory map."""
+    hasher = _new_hasher()
+    with open(file_path, 'rb') as f:
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+    return _hexdigest(hasher)
 
 
 class CacheManager:
@@ -42,94 +181,362 @@ class CacheManager:
             cache_expiration: Cache expiration time in seconds (default: 7 days)
             max_cache_size: Maximum cache size in bytes (default: 100 MB)
         """
-        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR or Path.home() / '.cv_generator' / 'cache')
         self.cache_expiration = cache_expiration
         self.max_cache_size = max_cache_size
         
         # Create cache directory if it doesn't exist
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # Create index file if it doesn't exist
         self.index_file = self.cache_dir / 'cache_index.json'
-        if not self.index_file.exists():
-            self._create_index()
+        self.log_file = self.cache_dir / 'cache_index.log'
+        self._log = None
+        
+        # Processes sharing the cache directory serialize index changes
+        # through a lock file
+        self.lock_file = self.cache_dir / 'cache_index.lock'
+        self._lock_fd = None
+        self._lock_depth = 0
+        
+        # Threads of this process take the mutex before the lock file
+        self._mutex = threading.RLock()
+        
+        # Access-time updates are kept in memory and logged lazily
+        self._pending_touches: Dict[str, float] = {}
+        self._last_flush = time.time()
+        
+        with self._locked():
+            # Create index file if it doesn't exist
+            if not self.index_file.exists():
+                self._create_index()
+            
+            self._reload()
+            
+            # Don't append records after a half-written one
+            if self._log_damaged:
+                self._compact()
         
-        # Load cache index
-        self.cache_index = self._load_index()
+        atexit.register(self._maybe_flush, force=True)
         
-        # Clean up expired cache entries
-        self._cleanup()
+        # Clean up expired cache entries in the background when it's due,
+        # so creating the manager doesn't wait on it
+        if self._cleanup_due():
+            threading.Thread(target=self._cleanup, name='cv-cache-cleanup',
+                             daemon=True).start()
     
-    def _create_index(self) -> None:
-        """Create a new cache index file."""
-        index = {
+    @contextmanager
+    def _locked(self, exclusive: bool = True):
+        """
+        Hold the cache directory lock for the duration of a block.
+        
+        Nested blocks run under the lock taken by the outermost one.
+        
+        Args:
+            exclusive: Take an exclusive lock rather than a shared one
+        """
+        with self._mutex:
+            with self._flocked(exclusive):
+                yield
+    
+    @contextmanager
+    def _flocked(self, exclusive: bool):
+        """Hold the lock file; the caller must hold the mutex."""
+        if fcntl is None or self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+            return
+        
+        operation = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+        while True:
+            if self._lock_fd is None:
+                self._lock_fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._lock_fd, operation)
+            
+            # clear() replaces the lock file; make sure we hold the current one
+            try:
+                if os.stat(self.lock_file).st_ino == os.fstat(self._lock_fd).st_ino:
+                    break
+            except FileNotFoundError:
+                pass
+            os.close(self._lock_fd)
+            self._lock_fd = None
+        
+        self._lock_depth += 1
+        try:
+            yield
+        finally:
+            self._lock_depth -= 1
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+    
+    def _new_index(self) -> Dict[str, Any]:
+        """Return an empty cache index."""
+        return {
             'entries': {},
-            'last_cleanup': time.time()
+            'last_cleanup': time.time(),
+            'total_size': 0
         }
-        with open(self.index_file, 'w') as f:
-            json.dump(index, f, indent=2)
+    
+    def _create_index(self) -> None:
+        """Create a new cache index file."""
+        _write_atomic(self.index_file, _dumps(self._new_index(), indent=True))
     
     def _load_index(self) -> Dict[str, Any]:
         """Load the cache index from file."""
         try:
-            with open(self.index_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            logger.warning("Cache index corrupted or missing, creating new one")
+            with open(self.index_file, 'rb') as f:
+                index = _loads(f.read())
+        except FileNotFoundError:
+            logger.warning("Cache index missing, creating new one")
             self._create_index()
-            with open(self.index_file, 'r') as f:
-                return json.load(f)
+            index = self._new_index()
+        except json.JSONDecodeError:
+            # Index writes are atomic, so this is a damaged file rather than
+            # an interrupted write; start over without reading it again
+            logger.warning("Cache index corrupted, starting with an empty one")
+            index = self._new_index()
+            
+            # Blobs left behind by the lost entries are found by a rescan
+            del index['total_size']
+        
+        # Entries are kept in least- to most-recently-used order
+        index['entries'] = OrderedDict(index.get('entries', {}))
+        return index
+    
+    def _reload(self) -> None:
+        """Load the index snapshot, then apply the changes logged since."""
+        self.cache_index = self._load_index()
+        rebuild = 'total_size' not in self.cache_index
+        
+        # Entries with identical content share one blob file
+        self._blob_refs = Counter(
+            entry['filename'] for entry in self.cache_index['entries'].values()
+        )
+        
+        # Total blob size is kept up to date instead of being re-summed
+        self._total_size = self.cache_index.get('total_size', 0)
+        
+        # Changes are appended to the log instead of rewriting the snapshot
+        if self._log is not None:
+            self._log.close()
+        self._log = open(self.log_file, 'ab', buffering=0)
+        self._log_offset = 0
+        self._log_lines = 0
+        self._log_damaged = False
+        self._sync_log()
+        
+        if rebuild:
+            self._total_size = self._rebuild_index_from_disk()
+            self._blob_refs = Counter(
+                entry['filename'] for entry in self.cache_index['entries'].values()
+            )
+            self._compact()
+    
+    def _rebuild_index_from_disk(self) -> int:
+        """
+        Reconcile the index with the blobs in the cache directory.
+        
+        Used when the index has no recorded total size, e.g. after it was
+        found corrupted. Keys can't be recovered from blobs, so blobs that no
+        entry refers to are deleted, entries whose blob is gone are dropped,
+        and entry sizes are taken from a single directory scan.
+        
+        Returns:
+            int: Total size of the remaining blobs in bytes
+        """
+        reserved = (self.index_file.name, self.log_file.name, self.lock_file.name)
+        blob_sizes = {}
+        with os.scandir(self.cache_dir) as it:
+            for dir_entry in it:
+                name = dir_entry.name
+                # Skip the index files and blobs still being written
+                if name.startswith(reserved) or name.endswith('.tmp'):
+                    continue
+                if dir_entry.is_file():
+                    blob_sizes[name] = dir_entry.stat().st_size
+        
+        entries = self.cache_index['entries']
+        for key in [key for key, entry in entries.items() if entry['filename'] not in blob_sizes]:
+            del entries[key]
+        
+        referenced = set()
+        for entry in entries.values():
+            entry['size'] = blob_sizes[entry['filename']]
+            referenced.add(entry['filename'])
+        
+        orphans = blob_sizes.keys() - referenced
+        for name in orphans:
+            try:
+                os.unlink(self.cache_dir / name)
+            except FileNotFoundError:
+                pass
+        if orphans:
+            logger.info("Removed %d unreferenced cache blobs", len(orphans))
+        
+        return sum(blob_sizes[name] for name in referenced)
+    
+    def _sync_log(self) -> None:
+        """
+        Apply the log records written since this process last read the log.
+        
+        Each record sets the final state of one entry, so replaying records
+        the snapshot already contains is harmless. Must be called with the
+        lock held.
+        """
+        try:
+            log_inode = os.stat(self.log_file).st_ino
+        except FileNotFoundError:
+            log_inode = None
+        if log_inode != os.fstat(self._log.fileno()).st_ino:
+            # Another process compacted the log or cleared the cache
+            self._reload()
+            return
+        
+        with open(self.log_file, 'rb') as f:
+            f.seek(self._log_offset)
+            data = f.read()
+        self._log_offset += len(data)
+        
+        for line in data.splitlines():
+            try:
+                record = _loads(line)
+            except ValueError:
+                # A crash can leave the last record half-written
+                logger.warning("Skipping unreadable cache log record")
+                self._log_damaged = True
+                continue
+            self._apply_record(record)
+            self._log_lines += 1
+    
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """Apply one change record to the in-memory index."""
+        entries = self.cache_index['entries']
+        op = record.get('op')
+        key = record.get('k')
+        
+        if op == 'put':
+            # Reference the new blob before releasing the one previously
+            # stored under this key, which may be the same file
+            entry = record['e']
+            self._pending_touches.pop(key, None)
+            self._take_blob(entry['filename'], entry.get('size', 0))
+            old_entry = entries.pop(key, None)
+            if old_entry is not None:
+                self._release_blob(old_entry['filename'], old_entry.get('size', 0))
+            entries[key] = entry
+        elif op == 'touch':
+            if key in entries:
+                entries[key]['last_accessed'] = record['t']
+                entries.move_to_end(key)
+        elif op == 'del':
+            self._pending_touches.pop(key, None)
+            old_entry = entries.pop(key, None)
+            if old_entry is not None:
+                self._release_blob(old_entry['filename'], old_entry.get('size', 0))
+        elif op == 'cleanup':
+            self.cache_index['last_cleanup'] = record['t']
+    
+    def _record(self, record: Dict[str, Any]) -> None:
+        """Apply a change record and append it to the index log."""
+        with self._locked():
+            self._sync_log()
+            self._apply_record(record)
+            
+            line = _dumps(record, sort_keys=False) + b"\n"
+            self._log.write(line)
+            self._log_offset = self._log.tell()
+            self._log_lines += 1
+            if self._log_offset > LOG_COMPACT_SIZE or self._log_lines > LOG_COMPACT_LINES:
+                self._compact()
+    
+    def _compact(self) -> None:
+        """Fold the index log into a fresh snapshot and start a new log."""
+        # The snapshot includes pending access times, so they needn't be logged
+        self._pending_touches.clear()
+        self._save_index()
+        
+        # Replace the log rather than truncating it so other processes notice
+        _write_atomic(self.log_file, b'')
+        self._log.close()
+        self._log = open(self.log_file, 'ab', buffering=0)
+        self._log_offset = 0
+        self._log_lines = 0
+        self._log_damaged = False
     
     def _save_index(self) -> None:
         """Save the cache index to file."""
-        with open(self.index_file, 'w') as f:
-            json.dump(self.cache_index, f, indent=2)
+        self.cache_index['total_size'] = self._total_size
+        
+        # Keep entry order on disk, it records recency of use. orjson
+        # serializes an OrderedDict in its underlying dict order, which
+        # move_to_end doesn't change, so write a plain dict copy.
+        index = dict(self.cache_index, entries=dict(self.cache_index['entries']))
+        _write_atomic(self.index_file, _dumps(index, indent=True, sort_keys=False))
+    
+    def _maybe_flush(self, force: bool = False) -> None:
+        """
+        Log the access times recorded since the last flush.
+        
+        Args:
+            force: Write immediately instead of waiting for the flush interval
+        """
+        if not self._pending_touches:
+            return
+        if force or time.time() - self._last_flush > INDEX_FLUSH_INTERVAL:
+            with self._locked():
+                touches = self._pending_touches
+                self._pending_touches = {}
+                for key, accessed in touches.items():
+                    self._record({'op': 'touch', 'k': key, 't': accessed})
+            self._last_flush = time.time()
+    
+    def _cleanup_due(self) -> bool:
+        """Check whether the daily cleanup should run."""
+        return time.time() - self.cache_index.get('last_cleanup', 0) >= 86400  # 24 hours in seconds
     
     def _cleanup(self) -> None:
         """Clean up expired cache entries and enforce size limits."""
-        now = time.time()
-        
         # Only run cleanup once per day
-        if now - self.cache_index.get('last_cleanup', 0) < 86400:  # 24 hours in seconds
+        if not self._cleanup_due():
             return
         
-        logger.info("Running cache cleanup")
-        
-        # Remove expired entries
-        expired_keys = []
-        for key, entry in self.cache_index.get('entries', {}).items():
-            if now - entry.get('timestamp', 0) > self.cache_expiration:
-                expired_keys.append(key)
-        
-        for key in expired_keys:
-            self.remove(key)
-        
-        # Check cache size and remove oldest entries if needed
-        total_size = self._get_cache_size()
-        if total_size > self.max_cache_size:
-            # Sort entries by timestamp (oldest first)
-            sorted_entries = sorted(
-                self.cache_index.get('entries', {}).items(),
-                key=lambda x: x[1].get('timestamp', 0)
-            )
+        with self._locked():
+            # Another thread or process may have cleaned up meanwhile
+            self._sync_log()
+            if not self._cleanup_due():
+                return
+            
+            logger.info("Running cache cleanup")
+            now = time.time()
             
-            # Remove oldest entries until we're under the size limit
-            for key, _ in sorted_entries:
+            # Remove expired entries
+            expired_keys = [
+                key for key, entry in self.cache_index['entries'].items()
+                if now - entry.get('timestamp', 0) > self.cache_expiration
+            ]
+            
+            for key in expired_keys:
                 self.remove(key)
-                total_size = self._get_cache_size()
-                if total_size <= self.max_cache_size:
-                    break
-        
-        # Update last cleanup timestamp
-        self.cache_index['last_cleanup'] = now
-        self._save_index()
+            logger.info("Removed %d expired cache entries", len(expired_keys))
+            
+            # Evict least recently used entries until we're under the size limit
+            entries = self.cache_index['entries']
+            evicted = 0
+            while entries and self._total_size > self.max_cache_size:
+                self.remove(next(iter(entries)))
+                evicted += 1
+            if evicted:
+                logger.info("Evicted %d cache entries to stay under %d bytes",
+                            evicted, self.max_cache_size)
+            
+            # Update last cleanup timestamp
+            self._record({'op': 'cleanup', 't': now})
     
     def _get_cache_size(self) -> int:
         """Get the total size of the cache in bytes."""
-        total_size = 0
-        for entry in self.cache_index.get('entries', {}).values():
-            total_size += entry.get('size', 0)
-        return total_size
+        return self._total_size
     
     def _generate_key(self, data: Dict[str, Any], style: str) -> str:
         """
@@ -142,12 +549,12 @@ class CacheManager:
         Returns:
             str: Cache key
         """
-        # Convert data to a stable string representation
-        data_str = json.dumps(data, sort_keys=True)
-        
-        # Generate a hash of the data and style
-        key_str = f"{data_str}_{style}"
-        return hashlib.md5(key_str.encode()).hexdigest()
+        # Stream a stable byte representation of the data into the hasher
+        # rather than serializing it in one piece
+        hasher = _new_hasher()
+        _canonical_feed(data, hasher.update)
+        hasher.update(b"\x00" + style.encode())
+        return _hexdigest(hasher)
     
     def get(self, key: str) -> Optional[Path]:
         """
@@ -159,31 +566,66 @@ class CacheManager:
         Returns:
             Optional[Path]: Path to the cached file, or None if not found
         """
-        if key not in self.cache_index.get('entries', {}):
-            return None
+        with self._mutex:
+            if key not in self.cache_index['entries']:
+                # Another process may have cached it since the log was last read
+                with self._locked(exclusive=False):
+                    self._sync_log()
+                if key not in self.cache_index['entries']:
+                    return None
+            
+            entry = self.cache_index['entries'][key]
+            file_path = self.cache_dir / entry['filename']
+            
+            if not file_path.exists():
+                # File is missing, remove from index
+                self.remove(key)
+                return None
+            
+            # Update access time and recency; the change is logged lazily
+            entry['last_accessed'] = time.time()
+            self.cache_index['entries'].move_to_end(key)
+            self._pending_touches[key] = entry['last_accessed']
+            self._maybe_flush()
+        
+        return file_path
+    
+    def get_bytes(self, key: str) -> Optional[memoryview]:
+        """
+        Get the contents of a cached file without copying them.
         
-        entry = self.cache_index['entries'][key]
-        file_path = self.cache_dir / entry['filename']
+        The returned memoryview is backed by a read-only memory map of the
+        cached blob; blobs are never modified in place, so the view stays
+        valid even if the entry is later removed.
         
-        if not file_path.exists():
-            # File is missing, remove from index
-            self.remove(key)
+        Args:
+            key: Cache key
+            
+        Returns:
+            Optional[memoryview]: Contents of the cached file, or None if not found
+        """
+        file_path = self.get(key)
+        if file_path is None:
             return None
         
-        # Update access timestamp
-        entry['last_accessed'] = time.time()
-        self._save_index()
-        
-        return file_path
+        with open(file_path, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                return memoryview(b'')
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
     
-    def put(self, key: str, file_path: Union[str, Path], file_type: str) -> Path:
+    def put(self, key: str, file_path: Union[str, Path], file_type: str,
+            move: bool = False) -> Path:
         """
         Add a file to the cache.
         
+        Files are stored as content-addressed blobs, so caching a file whose
+        contents are already in the cache doesn't copy anything.
+        
         Args:
             key: Cache key
             file_path: Path to the file to cache
             file_type: Type of file (e.g., 'latex', 'pdf')
+            move: Move the file into the cache instead of copying it
             
         Returns:
             Path: Path to the cached file
@@ -192,58 +634,129 @@ class CacheManager:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        # Create a filename with the key and original extension
-        cached_filename = f"{key}_{file_type}{file_path.suffix}"
+        # Name the blob after its contents and keep the original extension
+        cached_filename = f"{_hash_file(file_path)}{file_path.suffix}"
         cached_path = self.cache_dir / cached_filename
         
-        # Copy the file to the cache directory
-        shutil.copy2(file_path, cached_path)
-        
-        # Add entry to index
-        self.cache_index.setdefault('entries', {})
-        self.cache_index['entries'][key] = {
-            'filename': cached_filename,
-            'timestamp': time.time(),
-            'last_accessed': time.time(),
-            'size': cached_path.stat().st_size,
-            'type': file_type
-        }
-        
-        self._save_index()
+        # Stage new contents outside the lock, since copying can take a while
+        tmp_path = None if cached_path.exists() else self._stage_blob(file_path, move)
+        try:
+            with self._locked():
+                # The blob must exist when its entry is recorded; until then a
+                # removal of another entry with the same contents may delete it
+                if not cached_path.exists():
+                    if tmp_path is None:
+                        tmp_path = self._stage_blob(file_path, move)
+                    try:
+                        os.link(tmp_path, cached_path)
+                    except OSError:
+                        os.replace(tmp_path, cached_path)
+                
+                # Add entry to index
+                entry = {
+                    'filename': cached_filename,
+                    'timestamp': time.time(),
+                    'last_accessed': time.time(),
+                    'size': cached_path.stat().st_size,
+                    'type': file_type
+                }
+                self._record({'op': 'put', 'k': key, 'e': entry})
+        finally:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+        
+        # A moved file that was never staged duplicates an existing blob
+        if move and tmp_path is None:
+            file_path.unlink()
         return cached_path
     
-    def remove(self, key: str) -> None:
+    def _stage_blob(self, file_path: Path, move: bool) -> Path:
         """
-        Remove a file from the cache.
+        Put a file's contents in a new temporary file in the cache directory.
         
         Args:
-            key: Cache key
+            file_path: Path to the file to cache
+            move: Move the file instead of copying it
+            
+        Returns:
+            Path: Path to the temporary file
         """
-        if key not in self.cache_index.get('entries', {}):
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            # mkstemp creates the file private, but blobs may be served by the
+            # web server
+            os.chmod(tmp_path, 0o644)
+            if move:
+                try:
+                    os.replace(file_path, tmp_path)
+                except OSError:
+                    # Moving across filesystems falls back to copy + unlink
+                    shutil.copyfile(file_path, tmp_path)
+                    file_path.unlink()
+            else:
+                # Copy only the file contents; copyfile uses the platform's
+                # zero-copy path (sendfile on Linux, fcopyfile on macOS) and
+                # skips copystat
+                shutil.copyfile(file_path, tmp_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return tmp_path
+    
+    def _take_blob(self, filename: str, size: int) -> None:
+        """Add one reference to a blob."""
+        if not self._blob_refs[filename]:
+            self._total_size += size
+        self._blob_refs[filename] += 1
+    
+    def _release_blob(self, filename: str, size: int) -> None:
+        """Drop one reference to a blob and delete it once it is unused."""
+        self._blob_refs[filename] -= 1
+        if self._blob_refs[filename] > 0:
             return
         
-        entry = self.cache_index['entries'][key]
-        file_path = self.cache_dir / entry['filename']
-        
-        # Remove the file if it exists
+        del self._blob_refs[filename]
+        self._total_size -= size
+        file_path = self.cache_dir / filename
         if file_path.exists():
             file_path.unlink()
+    
+    def remove(self, key: str) -> None:
+        """
+        Remove a file from the cache.
         
-        # Remove entry from index
-        del self.cache_index['entries'][key]
-        self._save_index()
+        Args:
+            key: Cache key
+        """
+        if key not in self.cache_index['entries']:
+            return
+        
+        # Remove entry from index, and the blob if no other entry uses it
+        self._record({'op': 'del', 'k': key})
     
     def clear(self) -> None:
         """Clear all cache entries."""
-        # Remove all files in the cache directory
-        for file_path in self.cache_dir.glob('*'):
-            if file_path.is_file() and file_path.name != 'cache_index.json':
-                file_path.unlink()
-        
-        # Reset the index
-        self.cache_index['entries'] = {}
-        self.cache_index['last_cleanup'] = time.time()
-        self._save_index()
+        with self._locked():
+            # Remove the whole cache directory in one go and start from scratch
+            self._log.close()
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            
+            if fcntl is not None:
+                # Move our lock over to the new lock file before anyone else
+                # can take it
+                old_fd = self._lock_fd
+                self._lock_fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+                os.close(old_fd)
+            
+            # Reset the index
+            self._create_index()
+            self._log = None
+            self._reload()
+            self._pending_touches.clear()
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -252,14 +765,12 @@ class CacheManager:
         Returns:
             Dict[str, Any]: Dictionary of cache statistics
         """
-        entries = self.cache_index.get('entries', {})
+        entries = self.cache_index['entries']
         total_size = self._get_cache_size()
         
         # Count entries by type
-        type_counts = {}
-        for entry in entries.values():
-            file_type = entry.get('type', 'unknown')
-            type_counts[file_type] = type_counts.get(file_type, 0) + 1
+        with self._mutex:
+            type_counts = Counter(entry.get('type', 'unknown') for entry in entries.values())
         
         return {
             'entry_count': len(entries),
@@ -268,13 +779,23 @@ class CacheManager:
             'max_size_mb': round(self.max_cache_size / (1024 * 1024), 2),
             'usage_percent': round((total_size / self.max_cache_size) * 100, 2) if self.max_cache_size > 0 else 0,
             'last_cleanup': self.cache_index.get('last_cleanup', 0),
-            'type_counts': type_counts
+            'type_counts': dict(type_counts)
         }
 
 
 # Global cache manager instance
 _cache_manager = None
 
+# Cache keys of recently looked up flat CV data, so repeat lookups skip
+# serializing and hashing the data
+HOT_CACHE_SIZE = 128
+_hot_cache: "OrderedDict[Tuple[Any, str], str]" = OrderedDict()
+_hot_cache_lock = threading.Lock()
+
+# Value types that can be compared directly instead of through their JSON form.
+# Floats are left out: 0.0 == -0.0, but they serialize to different keys
+_SCALAR_TYPES = (str, int, bool, type(None))
+
 
 def get_cache_manager() -> CacheManager:
     """
@@ -304,6 +825,38 @@ def cache_cv_data(data: Dict[str, Any], style: str) -> str:
     return cache_manager._generate_key(data, style)
 
 
+def _lookup_key(data: Dict[str, Any], style: str) -> str:
+    """
+    Get the cache key for CV data and style, reusing recent results.
+    
+    Args:
+        data: CV data dictionary
+        style: CV style name
+        
+    Returns:
+        str: Cache key
+    """
+    cache_manager = get_cache_manager()
+    if not all(isinstance(value, _SCALAR_TYPES) for value in data.values()):
+        # Nested data is no cheaper to compare than to hash
+        return cache_manager._generate_key(data, style)
+    
+    # Include value types so that e.g. 1 and True don't share a key
+    hot_key = (frozenset((k, type(v), v) for k, v in data.items()), style)
+    with _hot_cache_lock:
+        key = _hot_cache.get(hot_key)
+        if key is not None:
+            _hot_cache.move_to_end(hot_key)
+            return key
+    
+    key = cache_manager._generate_key(data, style)
+    with _hot_cache_lock:
+        _hot_cache[hot_key] = key
+        if len(_hot_cache) > HOT_CACHE_SIZE:
+            _hot_cache.popitem(last=False)
+    return key
+
+
 def get_cached_pdf(data: Dict[str, Any], style: str) -> Optional[Path]:
     """
     Get a cached PDF for CV data and style.
@@ -316,7 +869,7 @@ def get_cached_pdf(data: Dict[str, Any], style: str) -> Optional[Path]:
         Optional[Path]: Path to the cached PDF, or None if not found
     """
     cache_manager = get_cache_manager()
-    key = cache_manager._generate_key(data, style)
+    key = _lookup_key(data, style)
     return cache_manager.get(key)
 
 
@@ -333,7 +886,7 @@ def cache_pdf(data: Dict[str, Any], style: str, pdf_path: Union[str, Path]) -> P
         Path: Path to the cached PDF
     """
     cache_manager = get_cache_manager()
-    key = cache_manager._generate_key(data, style)
+    key = _lookup_key(data, style)
     return cache_manager.put(key, pdf_path, 'pdf')
 
 
@@ -341,6 +894,7 @@ def clear_cache() -> None:
     """Clear the CV cache."""
     cache_manager = get_cache_manager()
     cache_manager.clear()
+    _hot_cache.clear()
 
 
 def get_cache_stats() -> Dict[str, Any]:
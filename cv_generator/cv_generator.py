@@ -7,38 +7,305 @@ a LaTeX CV using the Awesome-CV template.
 """
 
 import os
+import hashlib
 import json
+import mmap
 import argparse
+import functools
 import re
+import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+# ijson is optional, and only its C (YAJL) backend is faster than json.load;
+# without it JSON input is parsed with json.load
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    ijson = None
+
+# Quoted value following the dash in a `Key- "Value"` line
+_VALUE_RE = re.compile(r'\s*"([^"]*)"')
+
+# Section templates. LaTeX braces are doubled for str.format; entry
+# templates take their fields positionally
+_SECTION_HEADER = (
+    "%-------------------------------------------------------------------------------\n"
+    "%\tSECTION TITLE\n"
+    "%-------------------------------------------------------------------------------\n"
+    "\\cvsection{{{title}}}\n"
+    "\n"
+    "\n"
+    "%-------------------------------------------------------------------------------\n"
+    "%\tCONTENT\n"
+    "%-------------------------------------------------------------------------------\n"
+    "\\begin{{{env}}}"
+)
+_SECTION_FOOTER = (
+    "\n"
+    "\n%---------------------------------------------------------"
+    "\n\\end{{{env}}}"
+)
+_ENTRY_RULE = "\n\n%---------------------------------------------------------"
+
+_SUMMARY_HEADER = _SECTION_HEADER.format(title="Summary", env="cvparagraph") + _ENTRY_RULE + "\n"
+_SUMMARY_FOOTER = "\n\\end{cvparagraph}"
+
+_EXPERIENCE_HEADER = _SECTION_HEADER.format(title="Work Experience", env="cventries")
+_EXPERIENCE_ENTRY = (
+    _ENTRY_RULE
+    + "\n  \\cventry"
+    "\n    {{{0}}} % Job title"
+    "\n    {{{1}}} % Organization"
+    "\n    {{{2}}} % Location"
+    "\n    {{{3}}} % Date(s)"
+    "\n    {{"
+)
+
+_EDUCATION_HEADER = _SECTION_HEADER.format(title="Education", env="cventries")
+_EDUCATION_ENTRY = (
+    _ENTRY_RULE
+    + "\n  \\cventry"
+    "\n    {{{0}}} % Degree"
+    "\n    {{{1}}} % Institution"
+    "\n    {{{2}}} % Location"
+    "\n    {{{3}}} % Date(s)"
+    "\n    {{"
+)
+
+_CERTIFICATES_HEADER = _SECTION_HEADER.format(title="Certificates", env="cventries")
+_CERTIFICATE_ENTRY = (
+    _ENTRY_RULE
+    + "\n  \\cventry"
+    "\n    {{{0}}} % Certificate name"
+    "\n    {{{1}}} % Issuer"
+    "\n    {{{2}}} % Location"
+    "\n    {{{3}}} % Date(s)"
+    "\n    {{"
+)
+
+_ENTRY_END = "\n    }"
+_CVENTRIES_FOOTER = _SECTION_FOOTER.format(env="cventries")
+
+_SKILLS_HEADER = _SECTION_HEADER.format(title="Skills", env="cvskills")
+_SKILL_ENTRY = (
+    _ENTRY_RULE
+    + "\n  \\cvskill"
+    "\n    {{{0}}} % Category"
+    "\n    {{{1}}} % Skills"
+)
+_SKILLS_FOOTER = _SECTION_FOOTER.format(env="cvskills")
+
+_HONORS_HEADER = _SECTION_HEADER.format(title="Honors \\& Awards", env="cvhonors")
+_HONOR_ENTRY = (
+    _ENTRY_RULE
+    + "\n  \\cvhonor"
+    "\n    {{{0}}} % Award"
+    "\n    {{{1}}} % Event"
+    "\n    {{{2}}} % Location"
+    "\n    {{{3}}} % Date(s)"
+)
+_HONORS_FOOTER = _SECTION_FOOTER.format(env="cvhonors")
+
+
+# LaTeX special characters and their escaped forms, applied in one
+# str.translate pass
+_LATEX_ESCAPE = str.maketrans({
+    "\\": "\\textbackslash{}",
+    "&": "\\&",
+    "%": "\\%",
+    "$": "\\$",
+    "#": "\\#",
+    "_": "\\_",
+    "{": "\\{",
+    "}": "\\}",
+    "~": "\\textasciitilde{}",
+    "^": "\\textasciicircum{}",
+})
+
+
+# Personal information fields and the template line each one renders, in order
+_PERSONAL_FIELDS = (
+    ("Position", "\\position{{{}}}"),
+    ("Address", "\\address{{{}}}"),
+    ("Mobile", "\\mobile{{{}}}"),
+    ("Email", "\\email{{{}}}"),
+    ("Homepage", "\\homepage{{{}}}"),
+    ("GitHub", "\\github{{{}}}"),
+    ("LinkedIn", "\\linkedin{{{}}}"),
+    ("Twitter", "\\twitter{{{}}}"),
+    ("Quote", "\\quote{{\"{}\"}}"),
+)
+
+_PERSONAL_INFO_HEADER = (
+    "%\tPERSONAL INFORMATION\n"
+    "%\tComment any of the lines below if they are not required\n"
+    "%-------------------------------------------------------------------------------\n"
+)
+
+# Markers for where generated content goes in a split main template. The
+# template is full of LaTeX braces, so it can't be a str.format string
+_PERSONAL_INFO = object()
+_SECTION_INPUTS = object()
+
+# Number of rendered CVs each generator keeps for repeated data
+RENDER_CACHE_SIZE = 32
+
+# Number of parsed text input files each generator keeps
+PARSE_CACHE_SIZE = 32
+
+# Total section entries above which sections are rendered on a thread pool
+PARALLEL_RENDER_MIN_ENTRIES = 500
+
+
+def _write_bytes(path: Path, *chunks: bytes) -> None:
+    """Write bytes to a file with a bare file descriptor, without a Python file object."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        for chunk in chunks:
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _render_items(entry: Dict[str, Any], description: str) -> str:
+    """Render an entry's bullet points as a cvitems block, if it has any."""
+    items = entry.get("items")
+    if not items:
+        return ""
+    return (
+        "\n      \\begin{cvitems} % " + description
+        + "".join(f"\n        \\item {{{item}}}" for item in items)
+        + "\n      \\end{cvitems}"
+    )
+
+
+def _escape_data(value: Any) -> Any:
+    """Return a copy of CV data with every string LaTeX-escaped."""
+    if isinstance(value, str):
+        return value.translate(_LATEX_ESCAPE)
+    if isinstance(value, dict):
+        return {key: _escape_data(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_escape_data(item) for item in value]
+    return value
+
+
+def _split_template(template: str) -> Tuple[Any, ...]:
+    """
+    Split the main template around the regions generate_cv replaces.
+    
+    Returns:
+        The template's fixed text, with the `_PERSONAL_INFO` and
+        `_SECTION_INPUTS` markers where generated content goes
+    """
+    parts = []
+    pos = 0
+    
+    # Personal information runs from its heading to the end of the quote line
+    personal_info_start = template.find("%\tPERSONAL INFORMATION")
+    personal_info_end = template.find("\\quote{")
+    if personal_info_start != -1 and personal_info_end != -1:
+        quote_end = template.find("\n\n", personal_info_end)
+        if quote_end != -1:
+            parts.append(template[:personal_info_start] + _PERSONAL_INFO_HEADER)
+            parts.append(_PERSONAL_INFO)
+            pos = quote_end
+    
+    # Section inputs run up to the blank line before \end{document}
+    input_start = template.find("\\input{resume/summary.tex}", pos)
+    if input_start != -1:
+        input_end = template.find("\\end{document}", input_start)
+        if input_end != -1:
+            end_doc_start = template.rfind("\n\n", 0, input_end)
+            if end_doc_start >= input_start:
+                parts.append(template[pos:input_start])
+                parts.append(_SECTION_INPUTS)
+                pos = end_doc_start
+    
+    parts.append(template[pos:])
+    return tuple(part for part in parts if part)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_template(template_dir: str) -> Tuple[str, Tuple[Any, ...], bytes]:
+    """
+    Load and pre-split the Awesome-CV template files in a directory.
+    
+    The templates don't change while the program runs, so each directory
+    is only read once.
+    
+    Args:
+        template_dir: Absolute path of the template directory
+        
+    Returns:
+        The main template, its split form with the fixed text UTF-8
+        encoded, and the contents of awesome-cv.cls
+    """
+    template_path = Path(template_dir)
+    
+    # Check the directory and the main template with one directory scan
+    try:
+        with os.scandir(template_path) as entries:
+            names = {entry.name for entry in entries}
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template directory not found: {template_dir}") from None
+    
+    # Load the main template
+    main_template_path = template_path / "resume.tex"
+    if "resume.tex" not in names:
+        raise FileNotFoundError(f"Main template file not found: {main_template_path}")
+    
+    # Decode straight from a read-only memory map of the file, without an
+    # intermediate read buffer
+    with open(main_template_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                main_template = str(mm, "utf-8")
+        else:
+            main_template = ""
+    
+    cls_bytes = (template_path / "awesome-cv.cls").read_bytes()
+    template_parts = tuple(
+        part.encode("utf-8") if isinstance(part, str) else part
+        for part in _split_template(main_template)
+    )
+    return main_template, template_parts, cls_bytes
 
 
 class CVGenerator:
     """Generate LaTeX CVs from structured data."""
 
-    def __init__(self, template_dir: str = "../build"):
+    def __init__(self, template_dir: str = "../build", escape_latex: bool = False):
         """
         Initialize the CV Generator.
         
         Args:
             template_dir: Directory containing the Awesome-CV template files
+            escape_latex: Escape LaTeX special characters in the CV data.
+                Leave off for data that already contains LaTeX markup or
+                has been sanitized
         """
         self.template_dir = Path(template_dir)
+        self.escape_latex = escape_latex
         self.output_dir = Path("output")
         self.output_dir.mkdir(exist_ok=True)
         
-        # Ensure template directory exists
-        if not self.template_dir.exists():
-            raise FileNotFoundError(f"Template directory not found: {template_dir}")
-        
-        # Load the main template
+        # Load the template files; they are read once per process
         self.main_template_path = self.template_dir / "resume.tex"
-        if not self.main_template_path.exists():
-            raise FileNotFoundError(f"Main template file not found: {self.main_template_path}")
+        self.main_template, self._template_parts, self._cls_bytes = _load_template(
+            str(self.template_dir.resolve())
+        )
+        
+        # Parsed text inputs by path, with the (mtime, size) they were parsed at
+        self._parse_cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
         
-        with open(self.main_template_path, "r") as f:
-            self.main_template = f.read()
+        # Rendered content of recently generated CVs, most recent last
+        self._render_cache: "OrderedDict[bytes, Tuple[str, Dict[str, bytes]]]" = OrderedDict()
     
     def parse_json_input(self, json_file: str) -> Dict[str, Any]:
         """
@@ -50,8 +317,24 @@ class CVGenerator:
         Returns:
             Dictionary containing the parsed CV data
         """
-        with open(json_file, "r") as f:
-            return json.load(f)
+        if ijson is None:
+            with open(json_file, "r") as f:
+                data = json.load(f)
+        else:
+            # Build the data one top-level field (i.e. one section) at a time
+            # instead of holding the whole document's parse state at once
+            with open(json_file, "rb") as f:
+                data = dict(ijson.kvitems(f, "", use_float=True))
+                
+                # kvitems yields nothing for a top-level value that isn't an
+                # object, so tell that apart from an empty one
+                if not data:
+                    f.seek(0)
+                    data = json.load(f)
+        
+        if not isinstance(data, dict):
+            raise ValueError(f"JSON input must be an object, not {type(data).__name__}: {json_file}")
+        return data
     
     def parse_text_input(self, text_file: str) -> Dict[str, Any]:
         """
@@ -61,55 +344,77 @@ class CVGenerator:
         Section- "Section Name"
         Key- "Value"
         
+        Results are reused while the file's modification time and size are
+        unchanged, so the returned dictionary should not be modified.
+        
         Args:
             text_file: Path to the text file
             
         Returns:
             Dictionary containing the parsed CV data
         """
+        st = os.stat(text_file)
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self._parse_cache.get(text_file)
+        if cached is not None and cached[0] == signature:
+            self._parse_cache.move_to_end(text_file)
+            return cached[1]
+        
+        data = self._parse_text_lines(text_file)
+        self._parse_cache[text_file] = (signature, data)
+        if len(self._parse_cache) > PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return data
+    
+    def _parse_text_lines(self, text_file: str) -> Dict[str, Any]:
+        """Parse the lines of a structured text file; see parse_text_input."""
         data = {}
         current_section = None
         current_list = None
         
-        with open(text_file, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Check if this is a section header
-                section_match = re.match(r'^([^-]+)-\s*"([^"]*)"$', line)
-                if section_match:
-                    key = section_match.group(1).strip()
-                    value = section_match.group(2).strip()
-                    
-                    if key.lower() == "section":
-                        current_section = value
-                        data[current_section] = []
-                        current_list = data[current_section]
-                    else:
-                        if current_section is None:
-                            # This is a top-level key-value pair
-                            data[key] = value
-                        else:
-                            # This is a key-value pair within a section
-                            if not current_list:
-                                current_list = []
-                                data[current_section] = current_list
-                            
-                            # If this is the first item in a new entry, create a new dict
-                            if key.lower() in ["company", "organization", "title", "position"]:
-                                current_list.append({})
-                            
-                            if current_list:
-                                current_list[-1][key] = value
-                
-                # Check if this is a list item (bullet point)
-                elif line.startswith("- ") and current_section is not None and current_list:
+        # Read the file in one go and drop blank lines in C. read_text has
+        # already normalized line endings, so splitting on "\n" gives the
+        # same lines as iterating over the file
+        text = Path(text_file).read_text()
+        for line in filter(None, map(str.strip, text.split("\n"))):
+            # Check if this is a list item (bullet point); these never
+            # look like key-value lines, so test the cheap case first
+            if line[:2] == "- ":
+                if current_section is not None and current_list:
                     item_text = line[2:].strip()
                     if "items" not in current_list[-1]:
                         current_list[-1]["items"] = []
                     current_list[-1]["items"].append(item_text)
+                continue
+            
+            # Check if this is a section header or key-value pair. A value
+            # always ends in a quote, so skip the regex for lines that don't
+            key, sep, rest = line.partition("-")
+            value_match = _VALUE_RE.fullmatch(rest) if sep and key and rest[-1:] == '"' else None
+            if value_match:
+                key = key.strip()
+                value = value_match.group(1).strip()
+                
+                if key.lower() == "section":
+                    current_section = value
+                    data[current_section] = []
+                    current_list = data[current_section]
+                else:
+                    if current_section is None:
+                        # This is a top-level key-value pair
+                        data[key] = value
+                    else:
+                        # This is a key-value pair within a section
+                        if not current_list:
+                            current_list = []
+                            data[current_section] = current_list
+                        
+                        # If this is the first item in a new entry, create a new dict
+                        if key.lower() in ["company", "organization", "title", "position"]:
+                            current_list.append({})
+                        
+                        if current_list:
+                            current_list[-1][key] = value
         
         return data
     
@@ -123,43 +428,13 @@ class CVGenerator:
         Returns:
             LaTeX code for the personal information section
         """
-        template = []
-        
         # Name
+        template = []
         if "FirstName" in data and "LastName" in data:
-            template.append(f"\\name{{{data.get('FirstName')}}}{{{data.get('LastName')}}}")
-        
-        # Position
-        if "Position" in data:
-            template.append(f"\\position{{{data.get('Position')}}}")
-        
-        # Address
-        if "Address" in data:
-            template.append(f"\\address{{{data.get('Address')}}}")
-        
-        # Contact info
-        if "Mobile" in data:
-            template.append(f"\\mobile{{{data.get('Mobile')}}}")
+            template.append(f"\\name{{{data['FirstName']}}}{{{data['LastName']}}}")
         
-        if "Email" in data:
-            template.append(f"\\email{{{data.get('Email')}}}")
-        
-        if "Homepage" in data:
-            template.append(f"\\homepage{{{data.get('Homepage')}}}")
-        
-        # Social media
-        if "GitHub" in data:
-            template.append(f"\\github{{{data.get('GitHub')}}}")
-        
-        if "LinkedIn" in data:
-            template.append(f"\\linkedin{{{data.get('LinkedIn')}}}")
-        
-        if "Twitter" in data:
-            template.append(f"\\twitter{{{data.get('Twitter')}}}")
-        
-        # Quote
-        if "Quote" in data:
-            template.append(f"\\quote{{\"{data.get('Quote')}\"}}") 
+        # Position, address, contact info, social media and quote
+        template += [line.format(data[key]) for key, line in _PERSONAL_FIELDS if key in data]
         
         return "\n".join(template)
     
@@ -176,24 +451,7 @@ class CVGenerator:
         if "Summary" not in data:
             return ""
         
-        template = [
-            "%-------------------------------------------------------------------------------",
-            "%\tSECTION TITLE",
-            "%-------------------------------------------------------------------------------",
-            "\\cvsection{Summary}",
-            "",
-            "",
-            "%-------------------------------------------------------------------------------",
-            "%\tCONTENT",
-            "%-------------------------------------------------------------------------------",
-            "\\begin{cvparagraph}",
-            "",
-            "%---------------------------------------------------------",
-            f"{data.get('Summary', '')}",
-            "\\end{cvparagraph}"
-        ]
-        
-        return "\n".join(template)
+        return f"{_SUMMARY_HEADER}{data['Summary']}{_SUMMARY_FOOTER}"
     
     def generate_experience(self, data: Dict[str, Any]) -> str:
         """
@@ -208,42 +466,14 @@ class CVGenerator:
         if "Work Experience" not in data or not data["Work Experience"]:
             return ""
         
-        template = [
-            "%-------------------------------------------------------------------------------",
-            "%\tSECTION TITLE",
-            "%-------------------------------------------------------------------------------",
-            "\\cvsection{Work Experience}",
-            "",
-            "",
-            "%-------------------------------------------------------------------------------",
-            "%\tCONTENT",
-            "%-------------------------------------------------------------------------------",
-            "\\begin{cventries}"
-        ]
-        
-        for job in data["Work Experience"]:
-            template.append("")
-            template.append("%---------------------------------------------------------")
-            template.append("  \\cventry")
-            template.append(f"    {{{job.get('Title', '')}}} % Job title")
-            template.append(f"    {{{job.get('Company', '')}}} % Organization")
-            template.append(f"    {{{job.get('Location', '')}}} % Location")
-            template.append(f"    {{{job.get('Date', '')}}} % Date(s)")
-            template.append("    {")
-            
-            if "items" in job and job["items"]:
-                template.append("      \\begin{cvitems} % Description(s) of tasks/responsibilities")
-                for item in job["items"]:
-                    template.append(f"        \\item {{{item}}}")
-                template.append("      \\end{cvitems}")
-            
-            template.append("    }")
-        
-        template.append("")
-        template.append("%---------------------------------------------------------")
-        template.append("\\end{cventries}")
-        
-        return "\n".join(template)
+        return _EXPERIENCE_HEADER + "".join(
+            _EXPERIENCE_ENTRY.format(
+                job.get("Title", ""), job.get("Company", ""), job.get("Location", ""), job.get("Date", "")
+            )
+            + _render_items(job, "Description(s) of tasks/responsibilities")
+            + _ENTRY_END
+            for job in data["Work Experience"]
+        ) + _CVENTRIES_FOOTER
     
     def generate_education(self, data: Dict[str, Any]) -> str:
         """
@@ -258,42 +488,14 @@ class CVGenerator:
         if "Education" not in data or not data["Education"]:
             return ""
         
-        template = [
-            "%-------------------------------------------------------------------------------",
-            "%\tSECTION TITLE",
-            "%-------------------------------------------------------------------------------",
-            "\\cvsection{Education}",
-            "",
-            "",
-            "%-------------------------------------------------------------------------------",
-            "%\tCONTENT",
-            "%-------------------------------------------------------------------------------",
-            "\\begin{cventries}"
-        ]
-        
-        for edu in data["Education"]:
-            template.append("")
-            template.append("%---------------------------------------------------------")
-            template.append("  \\cventry")
-            template.append(f"    {{{edu.get('Degree', '')}}} % Degree")
-            template.append(f"    {{{edu.get('Institution', '')}}} % Institution")
-            template.append(f"    {{{edu.get('Location', '')}}} % Location")
-            template.append(f"    {{{edu.get('Date', '')}}} % Date(s)")
-            template.append("    {")
-            
-            if "items" in edu and edu["items"]:
-                template.append("      \\begin{cvitems} % Description(s)")
-                for item in edu["items"]:
-                    template.append(f"        \\item {{{item}}}")
-                template.append("      \\end{cvitems}")
-            
-            template.append("    }")
-        
-        template.append("")
-        template.append("%---------------------------------------------------------")
-        template.append("\\end{cventries}")
-        
-        return "\n".join(template)
+        return _EDUCATION_HEADER + "".join(
+            _EDUCATION_ENTRY.format(
+                edu.get("Degree", ""), edu.get("Institution", ""), edu.get("Location", ""), edu.get("Date", "")
+            )
+            + _render_items(edu, "Description(s)")
+            + _ENTRY_END
+            for edu in data["Education"]
+        ) + _CVENTRIES_FOOTER
     
     def generate_skills(self, data: Dict[str, Any]) -> str:
         """
@@ -308,31 +510,12 @@ class CVGenerator:
         if "Skills" not in data or not data["Skills"]:
             return ""
         
-        template = [
-            "%-------------------------------------------------------------------------------",
-            "%\tSECTION TITLE",
-            "%-------------------------------------------------------------------------------",
-            "\\cvsection{Skills}",
-            "",
-            "",
-            "%-------------------------------------------------------------------------------",
-            "%\tCONTENT",
-            "%-------------------------------------------------------------------------------",
-            "\\begin{cvskills}"
-        ]
-        
-        for skill in data["Skills"]:
-            template.append("")
-            template.append("%---------------------------------------------------------")
-            template.append("  \\cvskill")
-            template.append(f"    {{{skill.get('Category', '')}}} % Category")
-            template.append(f"    {{{skill.get('Skills', '')}}} % Skills")
-        
-        template.append("")
-        template.append("%---------------------------------------------------------")
-        template.append("\\end{cvskills}")
-        
-        return "\n".join(template)
+        return _SKILLS_HEADER + "".join(
+            _SKILL_ENTRY.format(
+                skill.get("Category", ""), skill.get("Skills", "")
+            )
+            for skill in data["Skills"]
+        ) + _SKILLS_FOOTER
     
     def generate_certificates(self, data: Dict[str, Any]) -> str:
         """
@@ -347,42 +530,14 @@ class CVGenerator:
         if "Certificates" not in data or not data["Certificates"]:
             return ""
         
-        template = [
-            "%-------------------------------------------------------------------------------",
-            "%\tSECTION TITLE",
-            "%-------------------------------------------------------------------------------",
-            "\\cvsection{Certificates}",
-            "",
-            "",
-            "%-------------------------------------------------------------------------------",
-            "%\tCONTENT",
-            "%-------------------------------------------------------------------------------",
-            "\\begin{cventries}"
-        ]
-        
-        for cert in data["Certificates"]:
-            template.append("")
-            template.append("%---------------------------------------------------------")
-            template.append("  \\cventry")
-            template.append(f"    {{{cert.get('Name', '')}}} % Certificate name")
-            template.append(f"    {{{cert.get('Issuer', '')}}} % Issuer")
-            template.append(f"    {{{cert.get('Location', '')}}} % Location")
-            template.append(f"    {{{cert.get('Date', '')}}} % Date(s)")
-            template.append("    {")
-            
-            if "items" in cert and cert["items"]:
-                template.append("      \\begin{cvitems} % Description(s)")
-                for item in cert["items"]:
-                    template.append(f"        \\item {{{item}}}")
-                template.append("      \\end{cvitems}")
-            
-            template.append("    }")
-        
-        template.append("")
-        template.append("%---------------------------------------------------------")
-        template.append("\\end{cventries}")
-        
-        return "\n".join(template)
+        return _CERTIFICATES_HEADER + "".join(
+            _CERTIFICATE_ENTRY.format(
+                cert.get("Name", ""), cert.get("Issuer", ""), cert.get("Location", ""), cert.get("Date", "")
+            )
+            + _render_items(cert, "Description(s)")
+            + _ENTRY_END
+            for cert in data["Certificates"]
+        ) + _CVENTRIES_FOOTER
     
     def generate_honors(self, data: Dict[str, Any]) -> str:
         """
@@ -397,33 +552,72 @@ class CVGenerator:
         if "Honors" not in data or not data["Honors"]:
             return ""
         
-        template = [
-            "%-------------------------------------------------------------------------------",
-            "%\tSECTION TITLE",
-            "%-------------------------------------------------------------------------------",
-            "\\cvsection{Honors \\& Awards}",
-            "",
-            "",
-            "%-------------------------------------------------------------------------------",
-            "%\tCONTENT",
-            "%-------------------------------------------------------------------------------",
-            "\\begin{cvhonors}"
-        ]
-        
-        for honor in data["Honors"]:
-            template.append("")
-            template.append("%---------------------------------------------------------")
-            template.append("  \\cvhonor")
-            template.append(f"    {{{honor.get('Name', '')}}} % Award")
-            template.append(f"    {{{honor.get('Issuer', '')}}} % Event")
-            template.append(f"    {{{honor.get('Location', '')}}} % Location")
-            template.append(f"    {{{honor.get('Date', '')}}} % Date(s)")
-        
-        template.append("")
-        template.append("%---------------------------------------------------------")
-        template.append("\\end{cvhonors}")
+        return _HONORS_HEADER + "".join(
+            _HONOR_ENTRY.format(
+                honor.get("Name", ""), honor.get("Issuer", ""), honor.get("Location", ""), honor.get("Date", "")
+            )
+            for honor in data["Honors"]
+        ) + _HONORS_FOOTER
+    
+    def _render(self, data: Dict[str, Any]) -> Tuple[str, Dict[str, bytes]]:
+        """
+        Render the personal information and sections for CV data.
         
-        return "\n".join(template)
+        Results for recently seen data are reused.
+        
+        Args:
+            data: Dictionary containing the CV data
+            
+        Returns:
+            The personal information LaTeX and a dict of section name to
+            UTF-8 encoded LaTeX
+        """
+        key = hashlib.blake2b(
+            json.dumps(data, sort_keys=True, default=str).encode(),
+            digest_size=16,
+            person=b"escaped" if self.escape_latex else b"",
+        ).digest()
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            self._render_cache.move_to_end(key)
+            return cached
+        
+        if self.escape_latex:
+            data = _escape_data(data)
+        
+        generators = (
+            ("summary", self.generate_summary),
+            ("experience", self.generate_experience),
+            ("education", self.generate_education),
+            ("skills", self.generate_skills),
+            ("certificates", self.generate_certificates),
+            ("honors", self.generate_honors),
+        )
+        
+        # The generators are independent, but a pool only pays for itself
+        # once there are enough entries to build
+        entries = sum(
+            len(data[name]) for name in ("Work Experience", "Education", "Skills", "Certificates", "Honors")
+            if isinstance(data.get(name), list)
+        )
+        if entries >= PARALLEL_RENDER_MIN_ENTRIES:
+            with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+                futures = [(name, executor.submit(generate, data)) for name, generate in generators]
+                contents = [(name, future.result()) for name, future in futures]
+        else:
+            contents = [(name, generate(data)) for name, generate in generators]
+        
+        sections = {}
+        for section_name, content in contents:
+            if content:
+                # Encoded once here so cached sections are written as-is
+                sections[section_name] = content.encode("utf-8")
+        
+        rendered = (self.generate_personal_info(data), sections)
+        self._render_cache[key] = rendered
+        if len(self._render_cache) > RENDER_CACHE_SIZE:
+            self._render_cache.popitem(last=False)
+        return rendered
     
     def generate_cv(self, data: Dict[str, Any], output_filename: str = "resume") -> str:
         """
@@ -436,38 +630,7 @@ class CVGenerator:
         Returns:
             Path to the generated LaTeX file
         """
-        # Create section files
-        sections = {}
-        
-        # Generate summary section
-        summary_content = self.generate_summary(data)
-        if summary_content:
-            sections["summary"] = summary_content
-        
-        # Generate experience section
-        experience_content = self.generate_experience(data)
-        if experience_content:
-            sections["experience"] = experience_content
-        
-        # Generate education section
-        education_content = self.generate_education(data)
-        if education_content:
-            sections["education"] = education_content
-        
-        # Generate skills section
-        skills_content = self.generate_skills(data)
-        if skills_content:
-            sections["skills"] = skills_content
-        
-        # Generate certificates section
-        certificates_content = self.generate_certificates(data)
-        if certificates_content:
-            sections["certificates"] = certificates_content
-        
-        # Generate honors section
-        honors_content = self.generate_honors(data)
-        if honors_content:
-            sections["honors"] = honors_content
+        personal_info, sections = self._render(data)
         
         # Create output directory for sections
         sections_dir = self.output_dir / "resume"
@@ -475,57 +638,24 @@ class CVGenerator:
         
         # Write section files
         for section_name, content in sections.items():
-            with open(sections_dir / f"{section_name}.tex", "w") as f:
-                f.write(content)
-        
-        # Copy the awesome-cv.cls file to the output directory
-        with open(self.template_dir / "awesome-cv.cls", "r") as src:
-            with open(self.output_dir / "awesome-cv.cls", "w") as dst:
-                dst.write(src.read())
-        
-        # Modify the main template with personal information
-        main_content = self.main_template
-        
-        # Replace personal information
-        personal_info_start = main_content.find("%\tPERSONAL INFORMATION")
-        personal_info_end = main_content.find("\\quote{")
-        
-        if personal_info_start != -1 and personal_info_end != -1:
-            # Find the end of the quote line
-            quote_end = main_content.find("\n\n", personal_info_end)
-            if quote_end != -1:
-                # Replace the personal information section
-                personal_info = self.generate_personal_info(data)
-                main_content = (
-                    main_content[:personal_info_start] +
-                    "%\tPERSONAL INFORMATION\n%\tComment any of the lines below if they are not required\n%-------------------------------------------------------------------------------\n" +
-                    personal_info +
-                    main_content[quote_end:]
-                )
-        
-        # Replace the input section with our generated sections
-        input_start = main_content.find("\\input{resume/summary.tex}")
-        if input_start != -1:
-            input_end = main_content.find("\\end{document}")
-            if input_end != -1:
-                # Find the beginning of the line containing \end{document}
-                end_doc_start = main_content.rfind("\n\n", 0, input_end)
-                if end_doc_start != -1:
-                    # Create the input section
-                    input_section = "\n"
-                    for section_name in sections:
-                        input_section += f"\\input{{resume/{section_name}.tex}}\n"
-                    
-                    main_content = (
-                        main_content[:input_start] +
-                        input_section +
-                        main_content[end_doc_start:]
-                    )
-        
-        # Write the main LaTeX file
+            _write_bytes(sections_dir / f"{section_name}.tex", content)
+        
+        # Write the awesome-cv.cls file to the output directory
+        (self.output_dir / "awesome-cv.cls").write_bytes(self._cls_bytes)
+        
+        # Write the main LaTeX file straight from the pre-split template,
+        # without joining it into one string first
+        personal_info_bytes = personal_info.encode("utf-8")
+        input_section = ("\n" + "".join(
+            f"\\input{{resume/{section_name}.tex}}\n" for section_name in sections
+        )).encode("utf-8")
         output_path = self.output_dir / f"{output_filename}.tex"
-        with open(output_path, "w") as f:
-            f.write(main_content)
+        _write_bytes(output_path, *(
+            personal_info_bytes if part is _PERSONAL_INFO
+            else input_section if part is _SECTION_INPUTS
+            else part
+            for part in self._template_parts
+        ))
         
         return str(output_path)
     
@@ -542,8 +672,13 @@ class CVGenerator:
         latex_path = Path(latex_file)
         output_dir = latex_path.parent
         
-        # Run xelatex to compile the LaTeX file
-        os.system(f"cd {output_dir} && xelatex {latex_path.name}")
+        # Run xelatex directly rather than through a shell; errors stop the run
+        # instead of waiting for input, and the full log is in the .log file
+        subprocess.run(
+            ["xelatex", "-interaction=nonstopmode", "-halt-on-error", latex_path.name],
+            cwd=output_dir,
+            stdout=subprocess.DEVNULL,
+        )
         
         # Return the path to the PDF file
         pdf_path = output_dir / f"{latex_path.stem}.pdf"
@@ -560,11 +695,12 @@ def main():
     parser.add_argument("--output", "-o", default="resume", help="Name of the output file (without extension)")
     parser.add_argument("--template-dir", "-t", default="../build", help="Directory containing the Awesome-CV template files")
     parser.add_argument("--compile", "-c", action="store_true", help="Compile the LaTeX file to PDF")
+    parser.add_argument("--escape-latex", action="store_true", help="Escape LaTeX special characters in the input")
     
     args = parser.parse_args()
     
     # Create the CV generator
-    generator = CVGenerator(template_dir=args.template_dir)
+    generator = CVGenerator(template_dir=args.template_dir, escape_latex=args.escape_latex)
     
     # Parse the input file
     if args.input_file.endswith(".json"):
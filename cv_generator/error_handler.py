@@ -8,18 +8,19 @@ user-friendly error messages, and recovering from common error conditions.
 
 import os
 import sys
-import traceback
+import time
+import functools
 import logging
-from typing import Dict, List, Any, Optional, Tuple, Union, Callable
+from collections import deque
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple, Union, Callable
 from pathlib import Path
-import json
-import shutil
-import tempfile
-import subprocess
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger('cv_error_handler')
+# json, shutil, subprocess, tempfile and traceback are only needed once
+# something has gone wrong, so they are imported where they are used
+
+# Logging is configured by the application
+logger = logging.getLogger(__name__)
 
 # Error types
 class CVGeneratorError(Exception):
@@ -46,6 +47,9 @@ class ConfigurationError(CVGeneratorError):
     """Exception for configuration errors."""
     pass
 
+# Characters of each LaTeX log line scanned for errors
+_LOG_LINE_SCAN_LIMIT = 500
+
 # Error messages
 ERROR_MESSAGES = {
     'template_not_found': "Template not found. Please check the template directory.",
@@ -59,6 +63,12 @@ ERROR_MESSAGES = {
     'unknown_error': "An unknown error occurred. Please try again."
 }
 
+def _log_traceback() -> None:
+    """Log the traceback of the exception being handled, if debug logging is on."""
+    if logger.isEnabledFor(logging.DEBUG):
+        import traceback
+        logger.debug(traceback.format_exc())
+
 # Error handlers
 def handle_template_error(error: Exception) -> str:
     """
@@ -71,7 +81,7 @@ def handle_template_error(error: Exception) -> str:
         str: User-friendly error message
     """
     logger.error(f"Template error: {str(error)}")
-    logger.debug(traceback.format_exc())
+    _log_traceback()
     
     if "not found" in str(error).lower():
         return ERROR_MESSAGES['template_not_found']
@@ -89,7 +99,7 @@ def handle_validation_error(error: Exception) -> str:
         str: User-friendly error message
     """
     logger.error(f"Validation error: {str(error)}")
-    logger.debug(traceback.format_exc())
+    _log_traceback()
     
     return f"Validation error: {str(error)}"
 
@@ -105,25 +115,27 @@ def handle_compilation_error(error: Exception, log_file: Optional[Path] = None)
         str: User-friendly error message
     """
     logger.error(f"Compilation error: {str(error)}")
-    logger.debug(traceback.format_exc())
+    _log_traceback()
     
     # Extract useful information from the log file if available
     error_details = ""
     if log_file and log_file.exists():
         try:
+            # Look for common LaTeX error patterns, keeping only the last 3
+            # error lines while reading the log a line at a time
+            error_lines = deque(maxlen=3)
             with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                log_content = f.read()
-            
-            # Look for common LaTeX error patterns
-            error_lines = []
-            for line in log_content.split('\n'):
-                if any(pattern in line for pattern in ['Error:', '!', 'Fatal error']):
-                    error_lines.append(line.strip())
+                for line in f:
+                    # TeX errors start with '!'; other tools report 'Error:'
+                    # near the start of the line, so only scan a prefix
+                    line = line[:_LOG_LINE_SCAN_LIMIT]
+                    if line.startswith('!') or 'Error:' in line or 'Fatal error' in line:
+                        error_lines.append(line.strip())
             
             if error_lines:
-                error_details = "\n".join(error_lines[-3:])  # Show the last 3 error lines
+                error_details = "\n".join(error_lines)
         except Exception as e:
-            logger.warning(f"Failed to read log file: {str(e)}")
+            logger.warning("Failed to read log file: %s", e)
     
     if error_details:
         return f"LaTeX compilation failed:\n{error_details}"
@@ -141,7 +153,7 @@ def handle_file_system_error(error: Exception) -> str:
         str: User-friendly error message
     """
     logger.error(f"File system error: {str(error)}")
-    logger.debug(traceback.format_exc())
+    _log_traceback()
     
     if isinstance(error, FileNotFoundError):
         return ERROR_MESSAGES['file_not_found']
@@ -163,7 +175,7 @@ def handle_configuration_error(error: Exception) -> str:
         str: User-friendly error message
     """
     logger.error(f"Configuration error: {str(error)}")
-    logger.debug(traceback.format_exc())
+    _log_traceback()
     
     return f"Configuration error: {str(error)}"
 
@@ -178,18 +190,32 @@ def handle_unknown_error(error: Exception) -> str:
         str: User-friendly error message
     """
     logger.error(f"Unknown error: {str(error)}")
-    logger.debug(traceback.format_exc())
+    _log_traceback()
     
     return ERROR_MESSAGES['unknown_error']
 
 # Error recovery
-def check_latex_installation() -> Tuple[bool, Optional[str]]:
+@functools.lru_cache(maxsize=None)
+def check_latex_installation(deep: bool = False) -> Tuple[bool, Optional[str]]:
     """
     Check if LaTeX is installed and working.
     
+    Args:
+        deep: Also run `xelatex --version` to check that it works, rather
+            than only looking it up on the PATH
+    
     Returns:
         Tuple[bool, Optional[str]]: (is_installed, error_message)
     """
+    import shutil
+    
+    if shutil.which('xelatex') is None:
+        return False, "XeLaTeX is not installed or not in PATH."
+    if not deep:
+        return True, None
+    
+    import subprocess
+    
     try:
         result = subprocess.run(['xelatex', '--version'], 
                                stdout=subprocess.PIPE, 
@@ -206,20 +232,30 @@ def check_latex_installation() -> Tuple[bool, Optional[str]]:
     except Exception as e:
         return False, f"Error checking LaTeX installation: {str(e)}"
 
-def check_dependencies() -> Dict[str, bool]:
+# time.monotonic() of the last uncached dependency check
+_dependencies_checked_at = None
+
+@functools.lru_cache(maxsize=1)
+def check_dependencies() -> Mapping[str, bool]:
     """
     Check if all required dependencies are installed.
     
+    The result is cached for the life of the process; call
+    `invalidate_dependency_cache` to check again.
+    
     Returns:
-        Dict[str, bool]: Dictionary of dependency names and their availability
+        Mapping[str, bool]: Read-only mapping of dependency names and their availability
     """
+    global _dependencies_checked_at
+    _dependencies_checked_at = time.monotonic()
+    
     dependencies = {
         'xelatex': False,
         'python_packages': False
     }
     
     # Check LaTeX
-    latex_installed, _ = check_latex_installation()
+    latex_installed, _ = check_latex_installation(deep=False)
     dependencies['xelatex'] = latex_installed
     
     # Check Python packages
@@ -230,7 +266,21 @@ def check_dependencies() -> Dict[str, bool]:
     except ImportError:
         dependencies['python_packages'] = False
     
-    return dependencies
+    return MappingProxyType(dependencies)
+
+def invalidate_dependency_cache(max_age: Optional[float] = None) -> None:
+    """
+    Forget cached dependency checks so the next call checks again.
+    
+    Args:
+        max_age: Only forget them if they are older than this many seconds
+            (if None, always forget them)
+    """
+    if (max_age is not None and _dependencies_checked_at is not None
+            and time.monotonic() - _dependencies_checked_at < max_age):
+        return
+    check_latex_installation.cache_clear()
+    check_dependencies.cache_clear()
 
 def create_fallback_pdf(output_path: Path, error_message: str) -> Path:
     """
@@ -243,6 +293,10 @@ def create_fallback_pdf(output_path: Path, error_message: str) -> Path:
     Returns:
         Path: Path to the created PDF
     """
+    import shutil
+    import subprocess
+    import tempfile
+    
     # Create a temporary directory
     temp_dir = Path(tempfile.mkdtemp())
     
@@ -274,8 +328,7 @@ Please check your input data and try again.
 """
     
     latex_file = temp_dir / "error.tex"
-    with open(latex_file, 'w') as f:
-        f.write(latex_content)
+    latex_file.write_text(latex_content)
     
     # Try to compile the LaTeX file
     try:
@@ -333,6 +386,7 @@ def log_error(error_message: str, context: Optional[Dict[str, Any]] = None) -> N
         context: Optional context information
     """
     if context:
+        import json
         logger.error(f"{error_message} Context: {json.dumps(context)}")
     else:
         logger.error(error_message)
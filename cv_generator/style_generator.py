@@ -10,13 +10,36 @@ import os
 import shutil
 import argparse
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 
 from style_library import get_all_styles
 
+# Styles whose colors awesome-cv.cls already defines
+STANDARD_STYLES = frozenset(["emerald", "skyblue", "red", "pink", "orange", "nephritis", "concrete", "darknight"])
 
-def generate_styled_cv(input_file: str, output_dir: str, styles: Optional[List[str]] = None) -> None:
+# The CV generator script, run once per style
+_CV_GENERATOR_SCRIPT = Path(__file__).resolve().parent / "cv_generator.py"
+
+# The line in awesome-cv.cls that selects the accent color
+_DEFAULT_COLORLET = "\\colorlet{awesome}{awesome-red}"
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link a file into place, falling back to a copy where links aren't possible."""
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def generate_styled_cv(input_file: str, output_dir: str, styles: Optional[List[str]] = None,
+                       max_workers: Optional[int] = None) -> Dict[str, Path]:
     """
     Generate CVs with different styles.
     
@@ -24,6 +47,11 @@ def generate_styled_cv(input_file: str, output_dir: str, styles: Optional[List[s
         input_file: Path to the input file (JSON or text)
         output_dir: Directory to store the generated CVs
         styles: List of styles to use (if None, uses all available styles)
+        max_workers: Most styles to build at once (if None, one per CPU)
+    
+    Returns:
+        Dict[str, Path]: Path of the PDF built for each style, for the
+        styles that produced one
     """
     # Create output directory
     output_path = Path(output_dir)
@@ -40,8 +68,7 @@ def generate_styled_cv(input_file: str, output_dir: str, styles: Optional[List[s
         raise FileNotFoundError(f"Awesome-CV class file not found: {cls_file}")
     
     # Read the class file
-    with open(cls_file, "r") as f:
-        cls_content = f.read()
+    cls_content = cls_file.read_text()
     
     # Get all available styles
     all_styles = get_all_styles()
@@ -50,95 +77,132 @@ def generate_styled_cv(input_file: str, output_dir: str, styles: Optional[List[s
     if styles is None:
         styles = list(all_styles.keys())
     
-    # Generate a CV for each style
+    # Custom color definitions go just before the colorlet line at the end
+    # of the awesome colors section; it is the same place for every style
+    awesome_colors_start = cls_content.find("% Awesome colors")
+    if awesome_colors_start == -1:
+        # If we can't find the section, find the last color definition
+        awesome_colors_start = cls_content.find("\\definecolor{awesome-darknight}")
+    awesome_colors_end = cls_content.find("\\colorlet{awesome}", awesome_colors_start)
+    
+    # Split there once; the colorlet line being changed starts the second part.
+    # Without a colorlet line, colors are only replaced throughout the file
+    if awesome_colors_end == -1:
+        cls_head, cls_tail = "", cls_content
+    else:
+        cls_head, cls_tail = cls_content[:awesome_colors_end], cls_content[awesome_colors_end:]
+    
+    # Template files other than the class file, which is rewritten per style
+    template_files = [
+        file for file in template_dir.glob("*")
+        if file.is_file() and file.name != "awesome-cv.cls"
+    ]
+    
+    # Work out each style's class file, then build the styles in parallel.
+    # The work happens in the cv_generator and xelatex child processes, so
+    # threads are enough to keep them all running
+    jobs = []
     for style in styles:
         # Skip if style is not in our library
         if style not in all_styles:
             print(f"Warning: Style '{style}' not found in style library. Skipping.")
             continue
-            
-        # Create a directory for this style
-        style_dir = output_path / style
-        style_dir.mkdir(exist_ok=True)
-        
-        # Copy the template files
-        for file in template_dir.glob("*"):
-            if file.is_file():
-                shutil.copy(file, style_dir)
         
-        # Modify the awesome-cv.cls file to use the custom style
-        style_cls_content = cls_content
-        
-        # Check if it's a standard style or a custom style
-        if style in ["emerald", "skyblue", "red", "pink", "orange", "nephritis", "concrete", "darknight"]:
-            # Standard style - just change the colorlet line
-            style_cls_content = style_cls_content.replace(
-                "\\colorlet{awesome}{awesome-red}",
-                f"\\colorlet{{awesome}}{{awesome-{style}}}"
-            )
-        else:
-            # Custom style - need to add a new color definition and use it
+        # Custom styles need a new color definition; standard styles
+        # only change the colorlet line
+        new_color_def = ""
+        if style not in STANDARD_STYLES and awesome_colors_end != -1:
             hex_color = all_styles[style]
-            
-            # Find the awesome colors section
-            awesome_colors_start = style_cls_content.find("% Awesome colors")
-            if awesome_colors_start == -1:
-                # If we can't find the section, find the last color definition
-                awesome_colors_start = style_cls_content.find("\\definecolor{awesome-darknight}")
-            
-            # Find the end of the awesome colors section
-            awesome_colors_end = style_cls_content.find("\\colorlet{awesome}", awesome_colors_start)
-            
-            # Add our new color definition before the colorlet line
-            new_color_def = f"\\definecolor{{awesome-{style}}}{{HTML}}{{{hex_color.replace('#', '')}}}\n"
-            
-            # Insert the new color definition
-            style_cls_content = (
-                style_cls_content[:awesome_colors_end] + 
-                new_color_def + 
-                style_cls_content[awesome_colors_end:]
-            )
-            
-            # Change the colorlet line
-            style_cls_content = style_cls_content.replace(
-                "\\colorlet{awesome}{awesome-red}",
-                f"\\colorlet{{awesome}}{{awesome-{style}}}"
-            )
-        
-        # Write the modified class file
-        with open(style_dir / "awesome-cv.cls", "w") as f:
-            f.write(style_cls_content)
+            new_color_def = f"\\definecolor{{awesome-{style}}}{{HTML}}{{{hex_color.lstrip('#')}}}\n"
         
-        # Generate the CV
-        cmd = [
-            "python", "cv_generator.py",
-            input_file,
-            "--output", f"{style}_resume",
-            "--template-dir", str(style_dir),
-            "--compile"
+        # Modify the awesome-cv.cls file to use the style
+        style_cls_content = cls_head + new_color_def + cls_tail.replace(
+            _DEFAULT_COLORLET,
+            f"\\colorlet{{awesome}}{{awesome-{style}}}"
+        )
+        jobs.append((style, style_cls_content))
+    
+    if not jobs:
+        return {}
+    
+    input_path = Path(input_file).resolve()
+    with ThreadPoolExecutor(max_workers=min(len(jobs), max_workers or os.cpu_count() or 1)) as executor:
+        futures = [
+            executor.submit(_build_style, style, style_cls_content, template_files, output_path, input_path)
+            for style, style_cls_content in jobs
         ]
-        
-        subprocess.run(cmd, check=True)
-        
-        # Move the generated files to the style directory
-        for ext in [".tex", ".pdf"]:
-            src = Path(f"output/{style}_resume{ext}")
-            if src.exists():
-                shutil.copy(src, style_dir)
-        
-        print(f"Generated CV with {style} style: {style_dir}/{style}_resume.pdf")
+        pdfs = {}
+        for (style, _), future in zip(jobs, futures):
+            pdf_path = future.result()
+            if pdf_path is not None:
+                pdfs[style] = pdf_path
+    return pdfs
 
 
+def _build_style(style: str, cls_content: str, template_files: List[Path],
+                 output_path: Path, input_file: Path) -> Optional[Path]:
+    """
+    Generate and compile the CV for one style in its own directory.
+    
+    The generator runs inside the style directory so that concurrent
+    builds don't share an output directory.
+    
+    Args:
+        style: Name of the style
+        cls_content: Contents of awesome-cv.cls for this style
+        template_files: Template files to copy, other than the class file
+        output_path: Directory to store the generated CVs
+        input_file: Absolute path to the input file
+        
+    Returns:
+        Optional[Path]: Path of the built PDF, or None if none was produced
+    """
+    # Create a directory for this style
+    style_dir = output_path / style
+    style_dir.mkdir(exist_ok=True)
+    
+    # Link the template files; they are the same for every style
+    for file in template_files:
+        _link_or_copy(file, style_dir / file.name)
+    
+    # Write the modified class file
+    (style_dir / "awesome-cv.cls").write_text(cls_content)
+    
+    # Generate the CV
+    cmd = [
+        "python", str(_CV_GENERATOR_SCRIPT),
+        str(input_file),
+        "--output", f"{style}_resume",
+        "--template-dir", ".",
+        "--compile"
+    ]
+    
+    subprocess.run(cmd, check=True, cwd=style_dir)
+    
+    # Move the generated files to the style directory. Replacing them,
+    # rather than writing over them, leaves links to earlier PDFs intact
+    pdf_path = None
+    for ext in [".tex", ".pdf"]:
+        src = style_dir / "output" / f"{style}_resume{ext}"
+        if src.exists():
+            os.replace(src, style_dir / src.name)
+            if ext == ".pdf":
+                pdf_path = style_dir / src.name
+    
+    print(f"Generated CV with {style} style: {style_dir}/{style}_resume.pdf")
+    return pdf_path
+
 def main():
     """Main entry point for the style generator."""
     parser = argparse.ArgumentParser(description="Generate CVs with different styles.")
     parser.add_argument("input_file", help="Path to the input file (JSON or text)")
     parser.add_argument("--output-dir", "-o", default="styled_output", help="Directory to store the generated CVs")
     parser.add_argument("--styles", "-s", nargs="+", default=None, help="Styles to use (if not specified, uses all available styles)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Most styles to build at once (default: one per CPU)")
     
     args = parser.parse_args()
     
-    generate_styled_cv(args.input_file, args.output_dir, args.styles)
+    generate_styled_cv(args.input_file, args.output_dir, args.styles, args.jobs)
 
 
 if __name__ == "__main__":
@@ -7,7 +7,7 @@ for the CV Generator. It includes both the standard Awesome-CV styles and many
 additional custom styles.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import random
 
 # Standard Awesome-CV styles
@@ -92,6 +92,12 @@ EXTENDED_STYLES = {
 # Combine standard and extended styles
 ALL_STYLES: Dict[str, str] = {**STANDARD_STYLES, **EXTENDED_STYLES}
 
+# Color of each style as a packed 0xRRGGBB integer
+_ALL_STYLES_INT: Dict[str, int] = {name: int(color[1:], 16) for name, color in ALL_STYLES.items()}
+
+# Style names to pick random styles from
+_ALL_STYLE_NAMES: Tuple[str, ...] = tuple(ALL_STYLES)
+
 # Group styles by color family for better organization
 COLOR_FAMILIES: Dict[str, List[str]] = {
     "Blues": ["skyblue", "royal-blue", "navy", "azure", "cobalt", "teal", "turquoise", "cerulean", "steel-blue"],
@@ -103,6 +109,11 @@ COLOR_FAMILIES: Dict[str, List[str]] = {
     "Grays & Blacks": ["concrete", "darknight", "charcoal", "slate", "graphite", "silver", "onyx", "jet", "ebony"]
 }
 
+# Color family of each style in COLOR_FAMILIES
+_STYLE_TO_FAMILY: Dict[str, str] = {
+    name: family for family, names in COLOR_FAMILIES.items() for name in names
+}
+
 def get_all_styles() -> Dict[str, str]:
     """
     Get all available styles.
@@ -121,6 +132,31 @@ def get_style_families() -> Dict[str, List[str]]:
     """
     return COLOR_FAMILIES
 
+def get_family_of(style: str) -> Optional[str]:
+    """
+    Get the color family of a style.
+    
+    Args:
+        style: The name of the style
+        
+    Returns:
+        Optional[str]: The name of the style's color family, or None if it has none
+    """
+    return _STYLE_TO_FAMILY.get(style)
+
+def get_style_rgb(style: str) -> Tuple[int, int, int]:
+    """
+    Get the color of a style as RGB components.
+    
+    Args:
+        style: The name of the style
+        
+    Returns:
+        Tuple[int, int, int]: The red, green and blue components, from 0 to 255
+    """
+    value = _ALL_STYLES_INT[style]
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+
 def get_random_style() -> Tuple[str, str]:
     """
     Get a random style from the library.
@@ -128,7 +164,7 @@ def get_random_style() -> Tuple[str, str]:
     Returns:
         Tuple[str, str]: A tuple containing (style_name, hex_color)
     """
-    style_name = random.choice(list(ALL_STYLES.keys()))
+    style_name = random.choice(_ALL_STYLE_NAMES)
     return style_name, ALL_STYLES[style_name]
 
 def get_random_style_from_family(family: str) -> Tuple[str, str]:
@@ -10,13 +10,20 @@ This module provides functionality for managing CV templates, including:
 """
 
 import os
+import functools
 import shutil
 import tempfile
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional, Tuple, Union
 import json
 import yaml
-import re
+
+# Use LibYAML's C dumper and loader when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
 
 # Template types
 TEMPLATE_TYPES = {
@@ -42,6 +49,59 @@ TEMPLATE_SECTIONS = [
     "interests"
 ]
 
+# Options that differ from the common defaults, per template type
+_TEMPLATE_DEFAULTS = {
+    "awesome-cv": {
+        "font_family": "sans",
+        "enable_hyperlinks": True,
+        "header_style": "standard"
+    },
+    "modern": {
+        "font_family": "sans",
+        "margin_size": "narrow",
+        "header_style": "compact"
+    },
+    "classic": {
+        "font_family": "serif",
+        "line_spacing": "1.5",
+        "margin_size": "moderate",
+        "header_style": "traditional"
+    },
+    "academic": {
+        "font_family": "serif",
+        "font_size": "12pt",
+        "line_spacing": "1.5",
+        "show_page_numbers": True,
+        "header_style": "detailed"
+    },
+    "minimal": {
+        "font_family": "sans",
+        "margin_size": "wide",
+        "section_spacing": "compact",
+        "header_style": "minimal"
+    }
+}
+
+# Options with a fixed set of values, with their valid values as a set
+# for lookups and as a list for error messages, and the name used in
+# error messages, in the order they are validated
+_OPTION_CHOICES = tuple((option, frozenset(values), values, label) for option, values, label in (
+    ("font_size", ["10pt", "11pt", "12pt"], "font size"),
+    ("paper_size", ["a4paper", "letterpaper"], "paper size"),
+    ("font_family", ["sans", "serif", "mono"], "font family"),
+    ("margin_size", ["narrow", "moderate", "wide"], "margin size"),
+    ("section_spacing", ["compact", "medium", "wide"], "section spacing"),
+    ("header_style", ["minimal", "standard", "compact", "traditional", "detailed"], "header style"),
+    ("footer_style", ["none", "minimal", "standard", "detailed"], "footer style"),
+))
+
+# Valid photo sizes, checked only when a photo is included
+_PHOTO_SIZES = ["small", "medium", "large"]
+_PHOTO_SIZE_SET = frozenset(_PHOTO_SIZES)
+
+# Digits allowed in a hex color code such as #0000EE
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+
 class TemplateError(Exception):
     """Custom exception for template errors."""
     pass
@@ -107,8 +167,29 @@ def customize_template(template_dir: Path, options: Dict[str, Any]) -> None:
     config_file = template_dir / "template_config.yaml"
     
     # Convert options to YAML and write to file
-    with open(config_file, "w") as f:
-        yaml.dump(options, f, default_flow_style=False)
+    config_file.write_text(yaml.dump(options, Dumper=_SafeDumper, default_flow_style=False))
+
+
+def load_template_configs(template_dirs: List[Path]) -> List[Dict[str, Any]]:
+    """
+    Load the options written by customize_template for several templates.
+    
+    Args:
+        template_dirs: Paths to the template directories
+        
+    Returns:
+        List[Dict[str, Any]]: Options for each template, in the same order
+            (empty for templates without a configuration file)
+    """
+    configs = []
+    for template_dir in template_dirs:
+        config_file = Path(template_dir) / "template_config.yaml"
+        if not config_file.exists():
+            configs.append({})
+            continue
+        with open(config_file, "rb") as f:
+            configs.append(yaml.load(f, Loader=_SafeLoader) or {})
+    return configs
 
 
 def apply_style_to_template(template_dir: Path, style_name: str, color_hex: str) -> None:
@@ -120,16 +201,21 @@ def apply_style_to_template(template_dir: Path, style_name: str, color_hex: str)
         style_name: Name of the style to apply
         color_hex: Hex color code for the style
     """
-    # Create a style file for the template
+    # Write style definitions to a style file for the template
     style_file = template_dir / "style.tex"
-    
-    # Write style definitions to file
-    with open(style_file, "w") as f:
-        f.write(f"% Style: {style_name}\n")
-        f.write(f"\\definecolor{{accent}}{{HTML}}{{{color_hex.replace('#', '')}}}\n")
-        f.write("\\colorlet{heading}{accent}\n")
-        f.write("\\colorlet{emphasis}{accent}\n")
-        f.write("\\colorlet{body}{black}\n")
+    style_file.write_text(_style_definitions(style_name, color_hex))
+
+
+@functools.lru_cache(maxsize=256)
+def _style_definitions(style_name: str, color_hex: str) -> str:
+    """Build the LaTeX style definitions written by apply_style_to_template."""
+    return (
+        f"% Style: {style_name}\n"
+        f"\\definecolor{{accent}}{{HTML}}{{{color_hex.replace('#', '')}}}\n"
+        "\\colorlet{heading}{accent}\n"
+        "\\colorlet{emphasis}{accent}\n"
+        "\\colorlet{body}{black}\n"
+    )
 
 
 def get_template_defaults(template_type: str) -> Dict[str, Any]:
@@ -142,6 +228,13 @@ def get_template_defaults(template_type: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Dictionary of default options
     """
+    # Callers may modify the result, so hand out a copy of the cached defaults
+    return dict(_template_defaults(template_type))
+
+
+@functools.lru_cache(maxsize=32)
+def _template_defaults(template_type: str) -> MappingProxyType:
+    """Build the default options for a template type; see get_template_defaults."""
     defaults = {
         "font_size": "11pt",
         "paper_size": "a4paper",
@@ -161,42 +254,9 @@ def get_template_defaults(template_type: str) -> Dict[str, Any]:
     }
     
     # Template-specific defaults
-    if template_type == "awesome-cv":
-        defaults.update({
-            "font_family": "sans",
-            "enable_hyperlinks": True,
-            "header_style": "standard"
-        })
-    elif template_type == "modern":
-        defaults.update({
-            "font_family": "sans",
-            "margin_size": "narrow",
-            "header_style": "compact"
-        })
-    elif template_type == "classic":
-        defaults.update({
-            "font_family": "serif",
-            "line_spacing": "1.5",
-            "margin_size": "moderate",
-            "header_style": "traditional"
-        })
-    elif template_type == "academic":
-        defaults.update({
-            "font_family": "serif",
-            "font_size": "12pt",
-            "line_spacing": "1.5",
-            "show_page_numbers": True,
-            "header_style": "detailed"
-        })
-    elif template_type == "minimal":
-        defaults.update({
-            "font_family": "sans",
-            "margin_size": "wide",
-            "section_spacing": "compact",
-            "header_style": "minimal"
-        })
+    defaults.update(_TEMPLATE_DEFAULTS.get(template_type, {}))
     
-    return defaults
+    return MappingProxyType(defaults)
 
 
 def validate_template_options(options: Dict[str, Any]) -> Tuple[bool, List[str]]:
@@ -211,58 +271,24 @@ def validate_template_options(options: Dict[str, Any]) -> Tuple[bool, List[str]]
     """
     errors = []
     
-    # Validate font size
-    if "font_size" in options:
-        valid_font_sizes = ["10pt", "11pt", "12pt"]
-        if options["font_size"] not in valid_font_sizes:
-            errors.append(f"Invalid font size: {options['font_size']}. Must be one of {valid_font_sizes}")
-    
-    # Validate paper size
-    if "paper_size" in options:
-        valid_paper_sizes = ["a4paper", "letterpaper"]
-        if options["paper_size"] not in valid_paper_sizes:
-            errors.append(f"Invalid paper size: {options['paper_size']}. Must be one of {valid_paper_sizes}")
-    
-    # Validate font family
-    if "font_family" in options:
-        valid_font_families = ["sans", "serif", "mono"]
-        if options["font_family"] not in valid_font_families:
-            errors.append(f"Invalid font family: {options['font_family']}. Must be one of {valid_font_families}")
-    
-    # Validate margin size
-    if "margin_size" in options:
-        valid_margin_sizes = ["narrow", "moderate", "wide"]
-        if options["margin_size"] not in valid_margin_sizes:
-            errors.append(f"Invalid margin size: {options['margin_size']}. Must be one of {valid_margin_sizes}")
-    
-    # Validate section spacing
-    if "section_spacing" in options:
-        valid_section_spacings = ["compact", "medium", "wide"]
-        if options["section_spacing"] not in valid_section_spacings:
-            errors.append(f"Invalid section spacing: {options['section_spacing']}. Must be one of {valid_section_spacings}")
-    
-    # Validate header style
-    if "header_style" in options:
-        valid_header_styles = ["minimal", "standard", "compact", "traditional", "detailed"]
-        if options["header_style"] not in valid_header_styles:
-            errors.append(f"Invalid header style: {options['header_style']}. Must be one of {valid_header_styles}")
-    
-    # Validate footer style
-    if "footer_style" in options:
-        valid_footer_styles = ["none", "minimal", "standard", "detailed"]
-        if options["footer_style"] not in valid_footer_styles:
-            errors.append(f"Invalid footer style: {options['footer_style']}. Must be one of {valid_footer_styles}")
+    # Validate options with a fixed set of values. Valid values are all
+    # strings; anything else (possibly unhashable) is simply invalid
+    for option, value_set, valid_values, label in _OPTION_CHOICES:
+        if option in options and not (isinstance(options[option], str)
+                                      and options[option] in value_set):
+            errors.append(f"Invalid {label}: {options[option]}. Must be one of {valid_values}")
     
     # Validate photo size
     if "photo_size" in options and options.get("include_photo", False):
-        valid_photo_sizes = ["small", "medium", "large"]
-        if options["photo_size"] not in valid_photo_sizes:
-            errors.append(f"Invalid photo size: {options['photo_size']}. Must be one of {valid_photo_sizes}")
+        photo_size = options["photo_size"]
+        if not (isinstance(photo_size, str) and photo_size in _PHOTO_SIZE_SET):
+            errors.append(f"Invalid photo size: {options['photo_size']}. Must be one of {_PHOTO_SIZES}")
     
     # Validate hyperlink color
     if "hyperlink_color" in options and options.get("enable_hyperlinks", False):
-        hex_pattern = r'^#[0-9A-Fa-f]{6}$'
-        if not re.match(hex_pattern, options["hyperlink_color"]):
+        color = options["hyperlink_color"]
+        if not (isinstance(color, str) and len(color) == 7 and color[0] == "#"
+                and not color[1:].strip(_HEX_DIGITS)):
             errors.append(f"Invalid hyperlink color: {options['hyperlink_color']}. Must be a valid hex color code (e.g., #0000EE)")
     
     return len(errors) == 0, errors
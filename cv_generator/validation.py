@@ -12,6 +12,76 @@ from typing import Dict, List, Any, Optional, Tuple, Union
 import json
 from pathlib import Path
 
+# Use orjson to parse JSON files when it is installed. Its decode error is a
+# subclass of json.JSONDecodeError, so both are handled the same way
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Patterns for contact fields, compiled once rather than on every validation.
+# Every character of a valid URL is in the path's character class, so the
+# URL pattern checks that up front; otherwise a bad character at the end
+# makes the host and path groups backtrack over the whole string
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(r'^(?=[-a-zA-Z0-9()@:%_\+.~#?&//=]*$)(https?:\/\/)?(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b([-a-zA-Z0-9()@:%_\+.~#?&//=]*)$')
+
+# Longest URL accepted for a contact field. Longer values are rejected
+# before the pattern runs, which bounds its work per field
+MAX_URL_LENGTH = 2048
+
+# Extensions of the supported CV file formats
+_FILE_SUFFIXES = ('.json', '.txt')
+
+# Personal information fields kept by sanitize_cv_data
+_PERSONAL_KEYS = ('FirstName', 'LastName', 'Position', 'Address', 'Mobile', 'Email',
+                  'Homepage', 'GitHub', 'LinkedIn', 'Quote', 'Summary')
+
+# Fields kept by sanitize_cv_data for each section, and whether its
+# entries have items
+_SECTION_SCHEMA = {
+    'Work Experience': (('Title', 'Company', 'Location', 'Date'), True),
+    'Education': (('Degree', 'Institution', 'Location', 'Date'), True),
+    'Skills': (('Category', 'Skills'), False),
+    'Certificates': (('Name', 'Issuer', 'Location', 'Date'), True),
+    'Honors': (('Name', 'Issuer', 'Location', 'Date'), False),
+}
+
+# Required fields of section entries: the name used for an entry in
+# error messages, and each required field with its name in messages
+_REQUIRED_FIELDS = {
+    'Work Experience': ('Work Experience', (('Title', 'Title'), ('Company', 'Company'))),
+    'Education': ('Education', (('Degree', 'Degree'), ('Institution', 'Institution'))),
+    'Skills': ('Skill', (('Category', 'Category'), ('Skills', 'Skills list'))),
+}
+
+# Fields read from each section of the TXT format; a Description becomes
+# the entry's items
+_TXT_SECTION_KEYS = {
+    'Work Experience': frozenset(['Title', 'Company', 'Location', 'Date', 'Description']),
+    'Education': frozenset(['Degree', 'Institution', 'Location', 'Date', 'Description']),
+    'Skills': frozenset(['Category', 'Skills']),
+    'Certificates': frozenset(['Name', 'Issuer', 'Location', 'Date', 'Description']),
+    'Honors': frozenset(['Name', 'Issuer', 'Location', 'Date']),
+}
+
+# LaTeX special characters and their escaped forms
+_LATEX_ESCAPE = str.maketrans({
+    '\\': r'\textbackslash{}',
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\textasciicircum{}',
+})
+
+# Any character that _LATEX_ESCAPE changes
+_LATEX_SPECIAL_RE = re.compile('[%s]' % re.escape(''.join(map(chr, _LATEX_ESCAPE))))
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
@@ -38,21 +108,32 @@ def validate_personal_info(data: Dict[str, Any]) -> List[str]:
     
     # Validate email format if provided
     if 'Email' in data and data['Email']:
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, data['Email']):
+        if '@' not in data['Email'] or not _EMAIL_RE.match(data['Email']):
             errors.append("Invalid email format")
     
     # Validate URLs if provided
     url_fields = ['Homepage', 'GitHub', 'LinkedIn']
-    url_pattern = r'^(https?:\/\/)?(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b([-a-zA-Z0-9()@:%_\+.~#?&//=]*)$'
     
     for field in url_fields:
-        if field in data and data[field] and not re.match(url_pattern, data[field]):
-            errors.append(f"Invalid URL format for {field}")
+        if field in data and data[field]:
+            url = data[field]
+            # Every valid URL has a dot before its top-level domain
+            if len(url) > MAX_URL_LENGTH or '.' not in url or not _URL_RE.match(url):
+                errors.append(f"Invalid URL format for {field}")
     
     return errors
 
 
+def _missing_fields(section: str, number: int, entry: Dict[str, Any]) -> List[str]:
+    """Return error messages for the required fields missing from a section entry."""
+    label, required = _REQUIRED_FIELDS[section]
+    return [
+        f"{label} #{number}: {name} is required"
+        for field, name in required
+        if field not in entry or not entry[field]
+    ]
+
+
 def validate_sections(data: Dict[str, Any]) -> List[str]:
     """
     Validate section data in CV.
@@ -64,30 +145,9 @@ def validate_sections(data: Dict[str, Any]) -> List[str]:
         List of validation error messages (empty if no errors)
     """
     errors = []
-    
-    # Validate Work Experience
-    if 'Work Experience' in data and data['Work Experience']:
-        for i, job in enumerate(data['Work Experience']):
-            if 'Title' not in job or not job['Title']:
-                errors.append(f"Work Experience #{i+1}: Title is required")
-            if 'Company' not in job or not job['Company']:
-                errors.append(f"Work Experience #{i+1}: Company is required")
-    
-    # Validate Education
-    if 'Education' in data and data['Education']:
-        for i, edu in enumerate(data['Education']):
-            if 'Degree' not in edu or not edu['Degree']:
-                errors.append(f"Education #{i+1}: Degree is required")
-            if 'Institution' not in edu or not edu['Institution']:
-                errors.append(f"Education #{i+1}: Institution is required")
-    
-    # Validate Skills
-    if 'Skills' in data and data['Skills']:
-        for i, skill in enumerate(data['Skills']):
-            if 'Category' not in skill or not skill['Category']:
-                errors.append(f"Skill #{i+1}: Category is required")
-            if 'Skills' not in skill or not skill['Skills']:
-                errors.append(f"Skill #{i+1}: Skills list is required")
+    for section in _REQUIRED_FIELDS:
+        for number, entry in enumerate(data.get(section) or (), 1):
+            errors.extend(_missing_fields(section, number, entry))
     
     return errors
 
@@ -128,15 +188,37 @@ def validate_file_format(file_path: Union[str, Path]) -> Tuple[bool, Optional[st
     if not file_path.exists():
         return False, "File does not exist", None
     
-    # Check file extension
-    if file_path.suffix.lower() not in ['.json', '.txt']:
+    # Check file extension before reading the file
+    if file_path.suffix.lower() not in _FILE_SUFFIXES:
+        return False, "Unsupported file format. Please use JSON or TXT files.", None
+    
+    try:
+        content = file_path.read_bytes()
+    except Exception as e:
+        return False, f"Error processing file: {str(e)}", None
+    
+    return validate_file_content(content, file_path.suffix)
+
+
+def validate_file_content(content: bytes, suffix: str) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+    """
+    Validate the content of a CV file that is already in memory.
+    
+    Args:
+        content: Raw bytes of the file
+        suffix: File extension, e.g. '.json', which selects the format
+        
+    Returns:
+        Tuple of (is_valid, error_message, data)
+    """
+    suffix = suffix.lower()
+    if suffix not in _FILE_SUFFIXES:
         return False, "Unsupported file format. Please use JSON or TXT files.", None
     
     try:
         # Handle JSON files
-        if file_path.suffix.lower() == '.json':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        if suffix == '.json':
+            data = _json_loads(content)
             
             # Validate structure
             is_valid, errors = validate_cv_data(data)
@@ -146,16 +228,14 @@ def validate_file_format(file_path: Union[str, Path]) -> Tuple[bool, Optional[st
             return True, None, data
         
         # Handle TXT files
-        elif file_path.suffix.lower() == '.txt':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Parse TXT format
-            data = parse_txt_format(lines)
+        else:
+            lines = content.decode('utf-8').splitlines()
             
-            # Validate structure
-            is_valid, errors = validate_cv_data(data)
-            if not is_valid:
+            # Parse TXT format. The parser has already checked the section
+            # entries, so only personal information is left to validate
+            data, section_errors = _parse_txt(lines)
+            errors = validate_personal_info(data) + section_errors
+            if errors:
                 return False, f"Invalid CV data: {', '.join(errors)}", None
             
             return True, None, data
@@ -176,8 +256,27 @@ def parse_txt_format(lines: List[str]) -> Dict[str, Any]:
     Returns:
         Dictionary containing CV data
     """
+    return _parse_txt(lines)[0]
+
+
+def _parse_txt(lines: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Parse TXT format, checking section entries for required fields as they are read.
+    
+    Args:
+        lines: List of text lines from the file
+        
+    Returns:
+        Tuple of (data, section_error_messages), where the errors are those
+        validate_sections would report for data
+    """
     data = {}
-    current_section = None
+    # Errors for each section with required fields, by section name
+    section_errors = {}
+    # Name, fields and entry list of the section being read, if any
+    section_name = None
+    section_keys = None
+    section_entries = None
     current_entry = None
     
     for line in lines:
@@ -187,83 +286,50 @@ def parse_txt_format(lines: List[str]) -> Dict[str, Any]:
         
         # Check for section headers
         if line.endswith(':'):
+            # Check the entry being read before leaving its section
+            if current_entry is not None and section_name in _REQUIRED_FIELDS:
+                section_errors[section_name].extend(
+                    _missing_fields(section_name, len(section_entries), current_entry))
+            
             section_name = line[:-1].strip()
-            if section_name in ['Work Experience', 'Education', 'Skills', 'Certificates', 'Honors']:
-                current_section = section_name
-                data[current_section] = []
-                current_entry = None
+            section_keys = _TXT_SECTION_KEYS.get(section_name)
+            current_entry = None
+            if section_keys is not None:
+                section_entries = data[section_name] = []
+                if section_name in _REQUIRED_FIELDS:
+                    section_errors[section_name] = []
             else:
                 # Handle personal info fields
-                current_section = None
-                current_entry = None
-                key, value = line.split(':', 1)
+                section_entries = None
+                key, _, value = line.partition(':')
                 data[key.strip()] = value.strip()
         
         # Handle section entries
-        elif current_section and line.startswith('-'):
-            # New entry in a section
-            entry_line = line[1:].strip()
-            
-            if ':' in entry_line:
-                key, value = entry_line.split(':', 1)
-                
+        elif section_keys is not None and line.startswith('-'):
+            key, sep, value = line[1:].partition(':')
+            if sep:
                 if current_entry is None:
                     current_entry = {}
-                    data[current_section].append(current_entry)
+                    section_entries.append(current_entry)
                 
-                if current_section == 'Work Experience':
-                    if key.strip() == 'Title':
-                        current_entry['Title'] = value.strip()
-                    elif key.strip() == 'Company':
-                        current_entry['Company'] = value.strip()
-                    elif key.strip() == 'Location':
-                        current_entry['Location'] = value.strip()
-                    elif key.strip() == 'Date':
-                        current_entry['Date'] = value.strip()
-                    elif key.strip() == 'Description':
-                        current_entry['items'] = [item.strip() for item in value.strip().split(',')]
-                
-                elif current_section == 'Education':
-                    if key.strip() == 'Degree':
-                        current_entry['Degree'] = value.strip()
-                    elif key.strip() == 'Institution':
-                        current_entry['Institution'] = value.strip()
-                    elif key.strip() == 'Location':
-                        current_entry['Location'] = value.strip()
-                    elif key.strip() == 'Date':
-                        current_entry['Date'] = value.strip()
-                    elif key.strip() == 'Description':
-                        current_entry['items'] = [item.strip() for item in value.strip().split(',')]
-                
-                elif current_section == 'Skills':
-                    if key.strip() == 'Category':
-                        current_entry['Category'] = value.strip()
-                    elif key.strip() == 'Skills':
-                        current_entry['Skills'] = value.strip()
-                
-                elif current_section == 'Certificates':
-                    if key.strip() == 'Name':
-                        current_entry['Name'] = value.strip()
-                    elif key.strip() == 'Issuer':
-                        current_entry['Issuer'] = value.strip()
-                    elif key.strip() == 'Location':
-                        current_entry['Location'] = value.strip()
-                    elif key.strip() == 'Date':
-                        current_entry['Date'] = value.strip()
-                    elif key.strip() == 'Description':
-                        current_entry['items'] = [item.strip() for item in value.strip().split(',')]
-                
-                elif current_section == 'Honors':
-                    if key.strip() == 'Name':
-                        current_entry['Name'] = value.strip()
-                    elif key.strip() == 'Issuer':
-                        current_entry['Issuer'] = value.strip()
-                    elif key.strip() == 'Location':
-                        current_entry['Location'] = value.strip()
-                    elif key.strip() == 'Date':
-                        current_entry['Date'] = value.strip()
+                key = key.strip()
+                if key in section_keys:
+                    value = value.strip()
+                    if key == 'Description':
+                        current_entry['items'] = [item.strip() for item in value.split(',')]
+                    else:
+                        current_entry[key] = value
+    
+    if current_entry is not None and section_name in _REQUIRED_FIELDS:
+        section_errors[section_name].extend(
+            _missing_fields(section_name, len(section_entries), current_entry))
+    
+    # Report errors in the order validate_sections does
+    errors = []
+    for section in _REQUIRED_FIELDS:
+        errors.extend(section_errors.get(section, ()))
     
-    return data
+    return data, errors
 
 
 def sanitize_input(text: str) -> str:
@@ -276,13 +342,39 @@ def sanitize_input(text: str) -> str:
     Returns:
         Sanitized text
     """
-    # Escape LaTeX special characters
-    latex_special_chars = ['&', '%', '$', '#', '_', '{', '}', '~', '^', '\\']
-    
-    for char in latex_special_chars:
-        text = text.replace(char, f'\\{char}')
-    
-    return text
+    # Most fields have nothing to escape. translate always builds a new
+    # string, while a search stops without allocating
+    if not _LATEX_SPECIAL_RE.search(text):
+        return text
+    
+    # Escape LaTeX special characters in a single pass, so the backslashes
+    # added by one escape are never escaped again
+    return text.translate(_LATEX_ESCAPE)
+
+
+def _sanitize_fields(entry: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """Sanitize the given fields of an entry, defaulting missing ones to ''."""
+    return {
+        key: sanitize_input(entry[key]) if entry.get(key) else entry.get(key, '')
+        for key in fields
+    }
+
+
+def _sanitize_personal(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Sanitize the personal information fields present in data."""
+    return {
+        key: sanitize_input(data[key]) if data[key] else data[key]
+        for key in _PERSONAL_KEYS
+        if key in data
+    }
+
+
+def _sanitize_entry(entry: Dict[str, Any], fields: Tuple[str, ...], has_items: bool) -> Dict[str, Any]:
+    """Sanitize a section entry, and its items if the section has them."""
+    sanitized_entry = _sanitize_fields(entry, fields)
+    if has_items:
+        sanitized_entry['items'] = list(map(sanitize_input, entry['items'])) if entry.get('items') else []
+    return sanitized_entry
 
 
 def sanitize_cv_data(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -295,92 +387,44 @@ def sanitize_cv_data(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Sanitized data dictionary
     """
-    # Create a deep copy to avoid modifying the original
-    sanitized = {}
-    
-    # Sanitize personal information
-    for key in ['FirstName', 'LastName', 'Position', 'Address', 'Mobile', 'Email', 
-                'Homepage', 'GitHub', 'LinkedIn', 'Quote', 'Summary']:
-        if key in data and data[key]:
-            sanitized[key] = sanitize_input(data[key])
-        else:
-            sanitized[key] = data.get(key, '')
-    
-    # Sanitize Work Experience
-    sanitized['Work Experience'] = []
-    if 'Work Experience' in data and data['Work Experience']:
-        for job in data['Work Experience']:
-            sanitized_job = {}
-            for key in ['Title', 'Company', 'Location', 'Date']:
-                if key in job and job[key]:
-                    sanitized_job[key] = sanitize_input(job[key])
-                else:
-                    sanitized_job[key] = job.get(key, '')
-            
-            sanitized_job['items'] = []
-            if 'items' in job and job['items']:
-                sanitized_job['items'] = [sanitize_input(item) for item in job['items']]
-            
-            sanitized['Work Experience'].append(sanitized_job)
-    
-    # Sanitize Education
-    sanitized['Education'] = []
-    if 'Education' in data and data['Education']:
-        for edu in data['Education']:
-            sanitized_edu = {}
-            for key in ['Degree', 'Institution', 'Location', 'Date']:
-                if key in edu and edu[key]:
-                    sanitized_edu[key] = sanitize_input(edu[key])
-                else:
-                    sanitized_edu[key] = edu.get(key, '')
-            
-            sanitized_edu['items'] = []
-            if 'items' in edu and edu['items']:
-                sanitized_edu['items'] = [sanitize_input(item) for item in edu['items']]
-            
-            sanitized['Education'].append(sanitized_edu)
-    
-    # Sanitize Skills
-    sanitized['Skills'] = []
-    if 'Skills' in data and data['Skills']:
-        for skill in data['Skills']:
-            sanitized_skill = {}
-            for key in ['Category', 'Skills']:
-                if key in skill and skill[key]:
-                    sanitized_skill[key] = sanitize_input(skill[key])
-                else:
-                    sanitized_skill[key] = skill.get(key, '')
-            
-            sanitized['Skills'].append(sanitized_skill)
-    
-    # Sanitize Certificates
-    sanitized['Certificates'] = []
-    if 'Certificates' in data and data['Certificates']:
-        for cert in data['Certificates']:
-            sanitized_cert = {}
-            for key in ['Name', 'Issuer', 'Location', 'Date']:
-                if key in cert and cert[key]:
-                    sanitized_cert[key] = sanitize_input(cert[key])
-                else:
-                    sanitized_cert[key] = cert.get(key, '')
-            
-            sanitized_cert['items'] = []
-            if 'items' in cert and cert['items']:
-                sanitized_cert['items'] = [sanitize_input(item) for item in cert['items']]
-            
-            sanitized['Certificates'].append(sanitized_cert)
-    
-    # Sanitize Honors
-    sanitized['Honors'] = []
-    if 'Honors' in data and data['Honors']:
-        for honor in data['Honors']:
-            sanitized_honor = {}
-            for key in ['Name', 'Issuer', 'Location', 'Date']:
-                if key in honor and honor[key]:
-                    sanitized_honor[key] = sanitize_input(honor[key])
-                else:
-                    sanitized_honor[key] = honor.get(key, '')
-            
-            sanitized['Honors'].append(sanitized_honor)
+    # Build a new dictionary to avoid modifying the original
+    sanitized = _sanitize_personal(data)
+    
+    # Sections missing from data are left out
+    for section, (fields, has_items) in _SECTION_SCHEMA.items():
+        if section in data:
+            sanitized[section] = [
+                _sanitize_entry(entry, fields, has_items) for entry in data[section] or ()
+            ]
     
     return sanitized
+
+
+def process_cv_data(data: Dict[str, Any]) -> Tuple[bool, List[str], Dict[str, Any]]:
+    """
+    Validate and sanitize CV data in a single pass over its sections.
+    
+    Gives the same results as validate_cv_data followed by
+    sanitize_cv_data.
+    
+    Args:
+        data: Dictionary containing CV data
+        
+    Returns:
+        Tuple of (is_valid, error_messages, sanitized_data)
+    """
+    errors = validate_personal_info(data)
+    sanitized = _sanitize_personal(data)
+    
+    for section, (fields, has_items) in _SECTION_SCHEMA.items():
+        if section not in data:
+            continue
+        required = section in _REQUIRED_FIELDS
+        entries = []
+        for number, entry in enumerate(data[section] or (), 1):
+            if required:
+                errors.extend(_missing_fields(section, number, entry))
+            entries.append(_sanitize_entry(entry, fields, has_items))
+        sanitized[section] = entries
+    
+    return len(errors) == 0, errors, sanitized
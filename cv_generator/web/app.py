@@ -11,30 +11,35 @@ This application provides a web interface for the CV Generator, allowing users t
 
 import os
 import sys
-import json
-import tempfile
+import errno
 import shutil
+import threading
 import time
 import logging
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import zip_longest
 from pathlib import Path
-import traceback
-import markdown
-import yaml
+
+# markdown is only needed by /markdown_preview, so it is imported there
 
 # Add parent directory to path to import cv_generator modules
 sys.path.append(str(Path(__file__).parent.parent))
 
-from flask import Flask, render_template, request, jsonify, send_file, url_for, redirect, session, flash
+from flask import Flask, render_template, request, jsonify, send_file, url_for, redirect, flash
 from werkzeug.utils import secure_filename
 from cv_generator import CVGenerator
 from style_generator import generate_styled_cv
 from style_library import get_all_styles, get_style_families, get_random_style
-from validation import validate_cv_data, sanitize_cv_data
+from validation import process_cv_data, validate_file_content
 from template_manager import get_available_templates, get_template_defaults
-from cache_manager import get_cached_pdf, cache_pdf, get_cache_stats, clear_cache
+from cache_manager import cache_cv_data, get_cache_manager, clear_cache
 from error_handler import (
     safe_execute, 
     check_dependencies, 
+    invalidate_dependency_cache,
     create_fallback_pdf, 
     log_error,
     TemplateError,
@@ -42,6 +47,12 @@ from error_handler import (
     CompilationError
 )
 
+# orjson is optional; fall back to Flask's JSON provider
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('cv_generator_web')
@@ -50,8 +61,83 @@ app = Flask(__name__,
             static_folder='static',
             template_folder='templates')
 
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+    
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider that encodes and decodes with orjson."""
+        
+        def dumps(self, obj, **kwargs):
+            option = orjson.OPT_SORT_KEYS if self.sort_keys else 0
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+    
+    # jsonify and request.get_json use the app's provider
+    app.json = OrjsonProvider(app)
+
+# Errors from os.link that mean linking is impossible here
+_LINK_UNSUPPORTED = frozenset(
+    code for code in (errno.EXDEV, errno.EPERM, getattr(errno, 'ENOTSUP', None),
+                      getattr(errno, 'EOPNOTSUPP', None))
+    if code is not None
+)
+
+def _load_secret_key(key_file):
+    """
+    Read the session secret key from a file, creating it on first use.
+    
+    Keeping the key on disk lets sessions survive restarts, and lets every
+    worker process share one key.
+    """
+    try:
+        key = key_file.read_bytes()
+    except FileNotFoundError:
+        key_file.parent.mkdir(parents=True, exist_ok=True)
+        key = os.urandom(32)
+        tmp_file = key_file.with_name(f'{key_file.name}.{uuid.uuid4().hex}.tmp')
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(key)
+        try:
+            # Linking fails if another worker created the key first; its key wins
+            os.link(tmp_file, key_file)
+        except FileExistsError:
+            key = key_file.read_bytes()
+        except OSError as e:
+            if e.errno not in _LINK_UNSUPPORTED:
+                raise
+            key = _create_key_file(key_file, key)
+        finally:
+            os.unlink(tmp_file)
+    
+    if not key:
+        raise RuntimeError(f'Secret key file {key_file} is empty; delete it to generate a new key')
+    return key
+
+def _create_key_file(key_file, key):
+    """
+    Write a new key file without hard links, returning the key that won.
+    
+    The file is created exclusively, so a worker that loses the race may see
+    it before its contents are written and waits for them.
+    """
+    try:
+        fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        for _ in range(50):
+            key = key_file.read_bytes()
+            if key:
+                break
+            time.sleep(0.01)
+        return key
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    return key
+
 # Set secret key for session management
-app.secret_key = os.environ.get('SECRET_KEY', os.urandom(24))
+app.secret_key = os.environ.get('SECRET_KEY') or _load_secret_key(Path(app.instance_path) / 'secret_key')
 
 # Configure upload folder
 UPLOAD_FOLDER = Path(__file__).parent / 'uploads'
@@ -73,9 +159,25 @@ LOG_FOLDER.mkdir(exist_ok=True)
 # Configure max content length (10 MB)
 app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024
 
+# Internal location under which a front-end Nginx serves the preview folder.
+# When set, downloads are handed to Nginx with X-Accel-Redirect instead of
+# being sent by Flask
+app.config['PREVIEW_ACCEL_REDIRECT'] = os.environ.get('PREVIEW_ACCEL_REDIRECT')
+
+# Behind Apache (mod_xsendfile) or lighttpd, send_file can hand files to the
+# server with an X-Sendfile header instead of sending them from Python
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE') == '1'
+
 # Get all available styles from the style library
-STYLES = list(get_all_styles().keys())
 STYLE_COLORS = get_all_styles()
+STYLES = list(STYLE_COLORS)
+STYLES_SET = frozenset(STYLES)
+
+# /random_style response body for each style, encoded once
+_RANDOM_STYLE_BODIES = {
+    name: app.json.dumps({'success': True, 'style': name, 'color': color})
+    for name, color in STYLE_COLORS.items()
+}
 STYLE_FAMILIES = get_style_families()
 
 # Get all available templates
@@ -84,6 +186,93 @@ TEMPLATES = get_available_templates()
 # Check dependencies
 DEPENDENCIES = check_dependencies()
 
+# Seconds for which browsers may keep PDFs served from the cache
+CACHED_PDF_MAX_AGE = 365 * 24 * 60 * 60
+
+# Seconds for which /check_dependencies reuses the last check
+DEPENDENCY_RECHECK_INTERVAL = 10.0
+
+# The generator always writes to the same output files, so requests in this
+# process take turns compiling; other requests are served meanwhile
+_COMPILE_LOCK = threading.Lock()
+
+# Awesome-CV template used by /generate. The generator keeps no per-CV
+# state, so one instance is shared, created on first use so a missing
+# template is reported by the request rather than at startup
+TEMPLATE_DIR = Path(__file__).parent.parent.parent / 'build'
+_generator = None
+
+# Background compiles started by /generate_async, by task id, oldest first.
+# Compiles take turns anyway, so one worker thread runs them
+MAX_TASKS = 256
+_TASK_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+_TASKS = OrderedDict()
+_TASKS_LOCK = threading.Lock()
+
+def _publish(src, dst):
+    """
+    Put a PDF in place for serving, hard-linking it where possible.
+    
+    The source must not be rewritten in place afterwards, since a link
+    shares its contents.
+    """
+    # The temporary name is unique to this call, so concurrent publishes of
+    # the same file never share it
+    tmp = dst.with_name(f'{dst.name}.{uuid.uuid4().hex}.tmp')
+    try:
+        os.link(src, tmp)
+    except OSError as e:
+        if e.errno not in _LINK_UNSUPPORTED:
+            raise
+        # Different filesystems, or links not supported. Never copy through a
+        # path that may be a link into the cache; copyfile moves the bytes in
+        # the kernel (sendfile on Linux, fcopyfile on macOS)
+        tmp.unlink(missing_ok=True)
+        try:
+            shutil.copyfile(src, tmp)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+    os.replace(tmp, dst)
+
+# Personal information fields of the CV form: the data key and form field
+_FORM_PERSONAL_FIELDS = (
+    ('FirstName', 'firstName'),
+    ('LastName', 'lastName'),
+    ('Position', 'position'),
+    ('Address', 'address'),
+    ('Mobile', 'mobile'),
+    ('Email', 'email'),
+    ('Homepage', 'homepage'),
+    ('GitHub', 'github'),
+    ('LinkedIn', 'linkedin'),
+    ('Quote', 'quote'),
+    ('Summary', 'summary'),
+)
+
+# Sections of the CV form: the data key, the prefix of its form fields,
+# each field's form name and data key, and whether entries have a
+# description that becomes their items
+_FORM_SECTIONS = (
+    ('Work Experience', 'work',
+     (('title', 'Title'), ('company', 'Company'), ('location', 'Location'), ('date', 'Date')), True),
+    ('Education', 'edu',
+     (('degree', 'Degree'), ('institution', 'Institution'), ('location', 'Location'), ('date', 'Date')), True),
+    ('Skills', 'skill',
+     (('category', 'Category'), ('list', 'Skills')), False),
+    ('Certificates', 'cert',
+     (('name', 'Name'), ('issuer', 'Issuer'), ('location', 'Location'), ('date', 'Date')), True),
+    ('Honors', 'honor',
+     (('name', 'Name'), ('issuer', 'Issuer'), ('location', 'Location'), ('date', 'Date')), False),
+)
+
+def _items(text):
+    """Split a form description into its non-empty, stripped lines."""
+    return list(filter(None, map(str.strip, text.splitlines())))
+
+# The rendered main page
+_index_html = None
+
 @app.route('/')
 def index():
     """Render the main page."""
@@ -92,18 +281,47 @@ def index():
         missing_deps = [dep for dep, installed in DEPENDENCIES.items() if not installed]
         flash(f"Warning: Missing dependencies: {', '.join(missing_deps)}", "warning")
     
-    return render_template('index.html', 
-                          styles=STYLES, 
-                          style_colors=STYLE_COLORS,
-                          style_families=STYLE_FAMILIES,
-                          templates=TEMPLATES,
-                          cache_stats=get_cache_stats())
+    # The page only depends on data fixed at startup, so it is rendered
+    # once; in debug mode it is re-rendered so template edits show up
+    global _index_html
+    if _index_html is None or app.debug:
+        _index_html = render_template('index.html', 
+                                      styles=STYLES, 
+                                      style_colors=STYLE_COLORS,
+                                      style_families=STYLE_FAMILIES,
+                                      templates=TEMPLATES)
+    return _index_html
 
 @app.route('/random_style', methods=['GET'])
 def random_style():
     """Get a random style."""
-    style_name, color_hex = get_random_style()
-    return jsonify({'success': True, 'style': style_name, 'color': color_hex})
+    style_name, _ = get_random_style()
+    return app.response_class(_RANDOM_STYLE_BODIES[style_name], mimetype='application/json')
+
+@lru_cache(maxsize=256)
+def _safe_filename(filename):
+    """secure_filename, remembered for recently uploaded names."""
+    return secure_filename(filename)
+
+def _save_upload(file):
+    """
+    Validate an uploaded CV file and, if it is valid, save it under a secure name.
+    
+    The content is validated from memory and written once, rather than
+    saved and read back.
+    
+    Returns the saved path, the CV data (None if the file is invalid) and
+    the validation error message.
+    """
+    file_path = app.config['UPLOAD_FOLDER'] / _safe_filename(file.filename)
+    content = file.read()
+    
+    is_valid, error_message, data = validate_file_content(content, file_path.suffix)
+    if not is_valid:
+        return file_path, None, error_message
+    
+    file_path.write_bytes(content)
+    return file_path, data, error_message
 
 @app.route('/upload', methods=['POST'])
 def upload_file():
@@ -122,190 +340,102 @@ def upload_file():
         if file_ext not in allowed_extensions:
             return jsonify({'error': f'Invalid file format. Allowed formats: {", ".join(allowed_extensions)}'}), 400
         
-        # Save file with secure filename
-        filename = secure_filename(file.filename)
-        file_path = app.config['UPLOAD_FOLDER'] / filename
-        file.save(file_path)
-        
-        # Validate file content
-        from validation import validate_file_format
-        is_valid, error_message, data = validate_file_format(file_path)
-        
-        if not is_valid:
+        file_path, data, error_message = _save_upload(file)
+        if data is None:
             return jsonify({'error': error_message}), 400
         
-        return jsonify({'success': True, 'filename': filename, 'data': data})
+        return jsonify({'success': True, 'filename': file_path.name, 'data': data})
     
     except Exception as e:
         log_error(f"Error in upload_file: {str(e)}")
         return jsonify({'error': f'An error occurred: {str(e)}'}), 500
 
+def _cv_data_from_form(form):
+    """Build CV data from the fields of the CV form."""
+    # Every field's values, read from the form in one pass into a plain dict
+    values = form.to_dict(flat=False)
+    data = {key: values.get(name, ('',))[0] for key, name in _FORM_PERSONAL_FIELDS}
+    
+    for section, prefix, fields, has_items in _FORM_SECTIONS:
+        columns = [values.get(f'{prefix}_{name}[]', ()) for name, _ in fields]
+        if has_items:
+            columns.append(values.get(f'{prefix}_description[]', ()))
+        
+        # Rows are aligned by position; missing fields are filled with ''.
+        # Rows without their first field are left out
+        entries = []
+        for row in zip_longest(*columns, fillvalue=''):
+            if row[0]:
+                entry = {key: value for (_, key), value in zip(fields, row)}
+                if has_items:
+                    entry['items'] = _items(row[-1])
+                entries.append(entry)
+        data[section] = entries
+    
+    return data
+
+def _get_generator():
+    """Get the process's CV generator, creating it on first use."""
+    global _generator
+    if _generator is None:
+        _generator = CVGenerator(template_dir=str(TEMPLATE_DIR))
+    return _generator
+
+def _get_pdf(data, style, cache_key=None):
+    """
+    Get the compiled PDF for CV data and style, compiling it on a cache miss.
+    
+    Returns the cached PDF's path, which is never rewritten in place, and
+    whether it was already cached. The cache key is computed unless given.
+    """
+    cache_manager = get_cache_manager()
+    if cache_key is None:
+        cache_key = cache_cv_data(data, style)
+    cached_pdf = cache_manager.get(cache_key)
+    if cached_pdf and cached_pdf.exists():
+        return cached_pdf, True
+    
+    with _COMPILE_LOCK:
+        generator = _get_generator()
+        
+        # Generate LaTeX file
+        latex_file = generator.generate_cv(data, output_filename='resume')
+        
+        # Compile LaTeX to PDF
+        pdf_file = generator.compile_latex(latex_file)
+        
+        # Cache the PDF for future use
+        return cache_manager.put(cache_key, pdf_file, 'pdf'), False
+
 @app.route('/generate', methods=['POST'])
 def generate_cv():
     """Generate CV from form data."""
     try:
-        # Get form data
-        data = {}
-        
-        # Personal information
-        data['FirstName'] = request.form.get('firstName', '')
-        data['LastName'] = request.form.get('lastName', '')
-        data['Position'] = request.form.get('position', '')
-        data['Address'] = request.form.get('address', '')
-        data['Mobile'] = request.form.get('mobile', '')
-        data['Email'] = request.form.get('email', '')
-        data['Homepage'] = request.form.get('homepage', '')
-        data['GitHub'] = request.form.get('github', '')
-        data['LinkedIn'] = request.form.get('linkedin', '')
-        data['Quote'] = request.form.get('quote', '')
-        
-        # Summary
-        data['Summary'] = request.form.get('summary', '')
-        
-        # Work Experience
-        work_experience = []
-        work_titles = request.form.getlist('work_title[]')
-        work_companies = request.form.getlist('work_company[]')
-        work_locations = request.form.getlist('work_location[]')
-        work_dates = request.form.getlist('work_date[]')
-        work_descriptions = request.form.getlist('work_description[]')
+        data = _cv_data_from_form(request.form)
         
-        for i in range(len(work_titles)):
-            if work_titles[i]:
-                job = {
-                    'Title': work_titles[i],
-                    'Company': work_companies[i] if i < len(work_companies) else '',
-                    'Location': work_locations[i] if i < len(work_locations) else '',
-                    'Date': work_dates[i] if i < len(work_dates) else '',
-                    'items': [item.strip() for item in work_descriptions[i].split('\n') if item.strip()] if i < len(work_descriptions) else []
-                }
-                work_experience.append(job)
-        
-        data['Work Experience'] = work_experience
-        
-        # Education
-        education = []
-        edu_degrees = request.form.getlist('edu_degree[]')
-        edu_institutions = request.form.getlist('edu_institution[]')
-        edu_locations = request.form.getlist('edu_location[]')
-        edu_dates = request.form.getlist('edu_date[]')
-        edu_descriptions = request.form.getlist('edu_description[]')
-        
-        for i in range(len(edu_degrees)):
-            if edu_degrees[i]:
-                edu = {
-                    'Degree': edu_degrees[i],
-                    'Institution': edu_institutions[i] if i < len(edu_institutions) else '',
-                    'Location': edu_locations[i] if i < len(edu_locations) else '',
-                    'Date': edu_dates[i] if i < len(edu_dates) else '',
-                    'items': [item.strip() for item in edu_descriptions[i].split('\n') if item.strip()] if i < len(edu_descriptions) else []
-                }
-                education.append(edu)
-        
-        data['Education'] = education
-        
-        # Skills
-        skills = []
-        skill_categories = request.form.getlist('skill_category[]')
-        skill_lists = request.form.getlist('skill_list[]')
-        
-        for i in range(len(skill_categories)):
-            if skill_categories[i]:
-                skill = {
-                    'Category': skill_categories[i],
-                    'Skills': skill_lists[i] if i < len(skill_lists) else ''
-                }
-                skills.append(skill)
-        
-        data['Skills'] = skills
-        
-        # Certificates
-        certificates = []
-        cert_names = request.form.getlist('cert_name[]')
-        cert_issuers = request.form.getlist('cert_issuer[]')
-        cert_locations = request.form.getlist('cert_location[]')
-        cert_dates = request.form.getlist('cert_date[]')
-        cert_descriptions = request.form.getlist('cert_description[]')
-        
-        for i in range(len(cert_names)):
-            if cert_names[i]:
-                cert = {
-                    'Name': cert_names[i],
-                    'Issuer': cert_issuers[i] if i < len(cert_issuers) else '',
-                    'Location': cert_locations[i] if i < len(cert_locations) else '',
-                    'Date': cert_dates[i] if i < len(cert_dates) else '',
-                    'items': [item.strip() for item in cert_descriptions[i].split('\n') if item.strip()] if i < len(cert_descriptions) else []
-                }
-                certificates.append(cert)
-        
-        data['Certificates'] = certificates
-        
-        # Honors
-        honors = []
-        honor_names = request.form.getlist('honor_name[]')
-        honor_issuers = request.form.getlist('honor_issuer[]')
-        honor_locations = request.form.getlist('honor_location[]')
-        honor_dates = request.form.getlist('honor_date[]')
-        
-        for i in range(len(honor_names)):
-            if honor_names[i]:
-                honor = {
-                    'Name': honor_names[i],
-                    'Issuer': honor_issuers[i] if i < len(honor_issuers) else '',
-                    'Location': honor_locations[i] if i < len(honor_locations) else '',
-                    'Date': honor_dates[i] if i < len(honor_dates) else ''
-                }
-                honors.append(honor)
-        
-        data['Honors'] = honors
-        
-        # Validate data
-        is_valid, errors = validate_cv_data(data)
+        # Validate data, and sanitize it to prevent LaTeX injection
+        is_valid, errors, sanitized_data = process_cv_data(data)
         if not is_valid:
             return jsonify({'error': f"Invalid CV data: {', '.join(errors)}"}), 400
-        
-        # Sanitize data to prevent LaTeX injection
-        data = sanitize_cv_data(data)
-        
-        # Save data to JSON file
-        json_file = app.config['UPLOAD_FOLDER'] / 'temp_cv.json'
-        with open(json_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        data = sanitized_data
         
         # Get selected style
         style = request.form.get('style', 'red')
         
-        # Check if we have a cached PDF for this data and style
-        cached_pdf = get_cached_pdf(data, style)
-        if cached_pdf and cached_pdf.exists():
-            # Copy the cached PDF to the preview folder
-            preview_pdf = PREVIEW_FOLDER / f'resume_{style}.pdf'
-            shutil.copy(cached_pdf, preview_pdf)
-            
-            # Return the preview URL
-            preview_url = url_for('static', filename=f'previews/resume_{style}.pdf')
-            return jsonify({'success': True, 'preview_url': preview_url, 'cached': True})
-        
-        # Generate CV
-        template_dir = Path(__file__).parent.parent.parent / 'build'
-        generator = CVGenerator(template_dir=str(template_dir))
-        
         try:
-            # Generate LaTeX file
-            latex_file = generator.generate_cv(data, output_filename='resume')
-            
-            # Compile LaTeX to PDF
-            pdf_file = generator.compile_latex(latex_file)
+            cache_key = cache_cv_data(data, style)
+            pdf_file, cached = _get_pdf(data, style, cache_key)
             
-            # Cache the PDF for future use
-            cache_pdf(data, style, pdf_file)
-            
-            # Copy the PDF to the preview folder with a unique name
+            # Publish the PDF to the preview folder with a unique name, for
+            # /preview and /download; linking it there copies nothing
             preview_pdf = PREVIEW_FOLDER / f'resume_{style}.pdf'
-            shutil.copy(pdf_file, preview_pdf)
+            _publish(pdf_file, preview_pdf)
             
-            # Return the preview URL
-            preview_url = url_for('static', filename=f'previews/resume_{style}.pdf')
+            # Return the preview URL. It names the cached PDF, so browsers
+            # can keep it for good
+            preview_url = url_for('cached_pdf', key=cache_key)
+            if cached:
+                return jsonify({'success': True, 'preview_url': preview_url, 'cached': True})
             return jsonify({'success': True, 'preview_url': preview_url})
         
         except Exception as e:
@@ -330,6 +460,86 @@ def generate_cv():
         log_error(f"Error in generate_cv: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+def _compile_and_publish(data, style, cache_key):
+    """Compile a CV, or take it from the cache, and publish it for preview."""
+    pdf_file, _ = _get_pdf(data, style, cache_key)
+    _publish(pdf_file, PREVIEW_FOLDER / f'resume_{style}.pdf')
+
+@app.route('/generate_async', methods=['POST'])
+def generate_async():
+    """Start generating a CV from form data in the background."""
+    try:
+        data = _cv_data_from_form(request.form)
+        
+        # Validate data, and sanitize it to prevent LaTeX injection
+        is_valid, errors, data = process_cv_data(data)
+        if not is_valid:
+            return jsonify({'error': f"Invalid CV data: {', '.join(errors)}"}), 400
+        
+        style = request.form.get('style', 'red')
+        
+        # Tasks are identified by their cache key, so submitting a CV that
+        # is already queued or compiling joins that task
+        task_id = cache_cv_data(data, style)
+        
+        with _TASKS_LOCK:
+            task = _TASKS.get(task_id)
+            if task is None or task[1].done():
+                future = _TASK_EXECUTOR.submit(_compile_and_publish, data, style, task_id)
+                _TASKS[task_id] = (style, future)
+            _TASKS.move_to_end(task_id)
+            # Forget the oldest tasks; their status can no longer be polled
+            while len(_TASKS) > MAX_TASKS:
+                _TASKS.popitem(last=False)
+        
+        return jsonify({'success': True, 'task_id': task_id}), 202
+    
+    except Exception as e:
+        log_error(f"Error in generate_async: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/generate/status/<task_id>')
+def generate_status(task_id):
+    """Get the state of a CV generation started by /generate_async."""
+    with _TASKS_LOCK:
+        task = _TASKS.get(task_id)
+    if task is None:
+        return jsonify({'error': 'Unknown task'}), 404
+    
+    style, future = task
+    if not future.done():
+        return jsonify({'success': True, 'state': 'running' if future.running() else 'pending'})
+    
+    error = future.exception()
+    if error is not None:
+        log_error(f"Error generating CV: {str(error)}")
+        return jsonify({'success': False, 'state': 'failed', 'error': str(error)})
+    
+    # Task ids are cache keys
+    preview_url = url_for('cached_pdf', key=task_id)
+    return jsonify({'success': True, 'state': 'done', 'preview_url': preview_url})
+
+@app.route('/generate_inline', methods=['POST'])
+def generate_inline():
+    """Generate CV from form data and return the PDF itself."""
+    try:
+        data = _cv_data_from_form(request.form)
+        
+        # Validate data, and sanitize it to prevent LaTeX injection
+        is_valid, errors, data = process_cv_data(data)
+        if not is_valid:
+            return jsonify({'error': f"Invalid CV data: {', '.join(errors)}"}), 400
+        
+        style = request.form.get('style', 'red')
+        pdf_file, _ = _get_pdf(data, style)
+        
+        # Stream the cached PDF; nothing is copied to the preview folder
+        return send_file(pdf_file, mimetype='application/pdf', download_name=f'resume_{style}.pdf')
+    
+    except Exception as e:
+        log_error(f"Error in generate_inline: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/generate_all_styles', methods=['POST'])
 def generate_all_styles():
     """Generate CV in all available styles."""
@@ -338,15 +548,10 @@ def generate_all_styles():
         if 'file' in request.files:
             file = request.files['file']
             if file.filename != '':
-                filename = secure_filename(file.filename)
-                file_path = app.config['UPLOAD_FOLDER'] / filename
-                file.save(file_path)
-                
-                # Validate file content
-                from validation import validate_file_format
-                is_valid, error_message, data = validate_file_format(file_path)
-                
-                if not is_valid:
+                # The style builds run in child processes, which read the
+                # CV from the saved file
+                file_path, data, error_message = _save_upload(file)
+                if data is None:
                     return jsonify({'error': error_message}), 400
                 
                 # Generate CVs with different styles
@@ -354,7 +559,7 @@ def generate_all_styles():
                 styled_output_dir.mkdir(exist_ok=True)
                 
                 # Use safe_execute to handle errors
-                success, result, error = safe_execute(
+                success, style_pdfs, error = safe_execute(
                     generate_styled_cv, 
                     str(file_path), 
                     str(styled_output_dir), 
@@ -364,14 +569,12 @@ def generate_all_styles():
                 if not success:
                     return jsonify({'error': error}), 500
                 
-                # Copy PDFs to preview folder
+                # Publish the PDFs that were built to the preview folder
                 preview_urls = {}
-                for style in STYLES:
-                    style_pdf = styled_output_dir / style / f'{style}_resume.pdf'
-                    if style_pdf.exists():
-                        preview_pdf = PREVIEW_FOLDER / f'resume_{style}.pdf'
-                        shutil.copy(style_pdf, preview_pdf)
-                        preview_urls[style] = url_for('static', filename=f'previews/resume_{style}.pdf')
+                for style, style_pdf in style_pdfs.items():
+                    preview_pdf = PREVIEW_FOLDER / f'resume_{style}.pdf'
+                    _publish(style_pdf, preview_pdf)
+                    preview_urls[style] = url_for('static', filename=f'previews/resume_{style}.pdf')
                 
                 return jsonify({'success': True, 'preview_urls': preview_urls})
         
@@ -381,10 +584,22 @@ def generate_all_styles():
         log_error(f"Error in generate_all_styles: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/cached/<key>.pdf')
+def cached_pdf(key):
+    """Serve a compiled CV from the PDF cache by its cache key."""
+    pdf_file = get_cache_manager().get(key)
+    if pdf_file is None:
+        return jsonify({'error': 'PDF not found'}), 404
+    
+    # A key always names the same data and style, so the PDF never changes
+    response = send_file(pdf_file, mimetype='application/pdf', conditional=True, max_age=CACHED_PDF_MAX_AGE)
+    response.cache_control.immutable = True
+    return response
+
 @app.route('/preview/<style>')
 def preview(style):
     """Preview a CV with a specific style."""
-    if style not in STYLES:
+    if style not in STYLES_SET:
         flash("Invalid style selected.", "error")
         return redirect(url_for('index'))
     
@@ -400,7 +615,7 @@ def preview(style):
 @app.route('/download/<style>')
 def download(style):
     """Download a CV with a specific style."""
-    if style not in STYLES:
+    if style not in STYLES_SET:
         flash("Invalid style selected.", "error")
         return redirect(url_for('index'))
     
@@ -409,7 +624,17 @@ def download(style):
         flash("No PDF available for this style. Please generate a CV first.", "warning")
         return redirect(url_for('index'))
     
-    return send_file(preview_pdf, as_attachment=True, download_name=f'resume_{style}.pdf')
+    accel_prefix = app.config['PREVIEW_ACCEL_REDIRECT']
+    if accel_prefix:
+        response = app.response_class(mimetype='application/pdf')
+        response.headers['X-Accel-Redirect'] = f"{accel_prefix.rstrip('/')}/{preview_pdf.name}"
+        response.headers['Content-Disposition'] = f'attachment; filename={preview_pdf.name}'
+        return response
+    
+    # The PDF is replaced whenever the style is regenerated, so clients must
+    # revalidate; an unchanged file then costs a 304 instead of a download
+    return send_file(preview_pdf, as_attachment=True, download_name=f'resume_{style}.pdf',
+                     conditional=True, etag=True, max_age=0)
 
 @app.route('/load_sample')
 def load_sample():
@@ -419,8 +644,7 @@ def load_sample():
         return jsonify({'error': 'Sample file not found'}), 404
     
     try:
-        with open(sample_path, 'r') as f:
-            sample_data = json.load(f)
+        sample_data = app.json.loads(sample_path.read_bytes())
         
         return jsonify({'success': True, 'data': sample_data})
     
@@ -457,19 +681,34 @@ def clear_cache_route():
 def check_dependencies_route():
     """Check if all required dependencies are installed."""
     try:
+        # This route is how users re-check after installing something;
+        # repeated requests within a few seconds share one check
+        invalidate_dependency_cache(max_age=DEPENDENCY_RECHECK_INTERVAL)
         dependencies = check_dependencies()
-        return jsonify({'success': True, 'dependencies': dependencies})
+        return jsonify({'success': True, 'dependencies': dict(dependencies)})
     
     except Exception as e:
         log_error(f"Error checking dependencies: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+# Markdown converters are reusable but not thread-safe, so each thread
+# keeps its own
+_markdown_local = threading.local()
+
+def _markdown_converter():
+    """Get this thread's Markdown converter, creating it on first use."""
+    converter = getattr(_markdown_local, 'converter', None)
+    if converter is None:
+        import markdown
+        converter = _markdown_local.converter = markdown.Markdown()
+    return converter
+
 @app.route('/markdown_preview', methods=['POST'])
 def markdown_preview():
     """Convert Markdown to HTML for preview."""
     try:
         md_text = request.form.get('markdown', '')
-        html = markdown.markdown(md_text)
+        html = _markdown_converter().reset().convert(md_text)
         return jsonify({'success': True, 'html': html})
     
     except Exception as e:
@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for the CV Generator Web UI.
+
+Serve the application with a production WSGI server instead of Flask's
+development server, e.g.:
+
+    gunicorn -w 1 -k gthread --threads 8 --timeout 120 wsgi:application
+"""
+
+from app import app as application